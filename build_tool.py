@@ -6,17 +6,30 @@ import os
 import re
 import sys
 import json
+import zlib
+import base64
+import hashlib
+import argparse
+import time
+import queue
 import shutil
+import signal
+import threading
 import traceback
 import subprocess
+from array import array
 from pathlib import Path
+from bisect import bisect_left
+from itertools import chain, count
+from collections import Counter, deque
 from collections.abc import Iterable
 import tkinter as tk
 from tkinter import ttk
 from tkinter import filedialog, messagebox
+from tkinter import font as tkfont
 from tkinter.simpledialog import Dialog
-import requests
-from bs4 import BeautifulSoup
+
+START_TIME = time.perf_counter()
 
 ########################•########################
 """                 DECORATORS                """
@@ -35,10 +48,6 @@ def try_except_decorator(func):
 """                   OPTIONS                 """
 ########################•########################
 
-# Key : Full License Name
-# Val : SPDX: + Shorter Name
-LICENSES = {}
-
 EXTENSION_TYPES = [
     "add-on",
     "theme",
@@ -103,6 +112,7 @@ PERMISSIONS = [
     "camera",
     "microphone",
 ]
+PERMISSION_REASON = "Required by the extension"
 
 PATH_EXCLUDE_PATTERNS = [
     "__pycache__/",
@@ -203,6 +213,20 @@ def get_file_extension(file_path):
     return Path(file_path).suffix.lower()
 
 
+def get_cache_dir():
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / create_safe_name(name=APP_NAME)
+
+
+EMAIL_PATTERN   = re.compile(r"[^@]+@[^@]+\.[^@]+")
+COPYRIGHT_PATTERN = re.compile(r"\d{4}(-\d{4})? \S.*")
+WEBSITE_PATTERN = re.compile(r'^(http[s]?://)?([a-zA-Z0-9-]+\.)+[a-zA-Z]{2,6}(/[\w\-._~:/?#[\]@!$&\'()*+,;=]*)?$')
+
 is_integer     = lambda item: isinstance(item, int)
 is_string      = lambda item: isinstance(item, str) and bool(item.strip())
 is_float       = lambda item: isinstance(item, float)
@@ -215,8 +239,8 @@ is_file_name   = lambda item: is_string(item) and len(os.path.splitext(item)) ==
 is_iterable    = lambda item: isinstance(item, Iterable) and not isinstance(item, (str, bytes))
 is_all_strs    = lambda item: is_iterable(item) and all(is_string(sub) for sub in item)
 is_ver_str     = lambda item: is_string(item) and len(item.split(".")) == 3 and all(sub.isdigit() for sub in item.split("."))
-is_email       = lambda item: is_string(item) and bool(re.match(r"[^@]+@[^@]+\.[^@]+", item))
-is_website     = lambda item: is_string(item) and bool(re.match(r'^(http[s]?://)?([a-zA-Z0-9-]+\.)+[a-zA-Z]{2,6}(/[\w\-._~:/?#[\]@!$&\'()*+,;=]*)?$', item))
+is_email       = lambda item: is_string(item) and bool(EMAIL_PATTERN.match(item))
+is_website     = lambda item: is_string(item) and bool(WEBSITE_PATTERN.match(item))
 is_str_int     = lambda item: is_string(item) and item.isdigit()
 
 does_file_ext_match           = lambda file_path, file_ext : is_path(file_path) and is_string(file_ext) and get_file_extension(file_path) == file_ext.lower()
@@ -229,10 +253,85 @@ does_file_name_match_with_ext = lambda file_path, file_name: is_path(file_path)
 
 APP_NAME = "Blender Extension Creator"
 APP_RESIZABLE = False
+APP_LAZY_TABS = True       # Build tab widgets on first selection
+LAZY_TABS_DELAY_MS = 100   # Then prefill the rest one tab per tick
+STARTUP_BUDGET_MS = 500    # Launch to interactive
 LABEL_WIDTH = 150
 PADX = 4
 PADY = 4
 WSTICKY = "nsew"
+LIST_WHEEL_ROWS = 3        # Rows per mouse wheel notch
+PALETTE_ROWS = 12          # Command palette result rows
+PALETTE_MAX_RESULTS = 200
+PALETTE_WIDTH = 60         # Chars
+
+# Licenses
+LICENSES_URL = "https://spdx.org/licenses/licenses.json"
+LICENSES_FORMAT = 1
+LICENSES_SNAPSHOT_FILE = Path(__file__).resolve().parent / "spdx_licenses.json"
+LICENSES_CACHE_FILE = get_cache_dir() / "licenses.json"
+LICENSES_CACHE_TTL = 60 * 60 * 24 * 7 # Seconds
+
+# License Detection
+FINGERPRINTS_FILE = Path(__file__).resolve().parent / "spdx_fingerprints.json"
+FINGERPRINTS_FORMAT = 2
+FINGERPRINT_SHINGLE = 5        # Words per shingle
+FINGERPRINT_SAMPLE_MOD = 8     # Long licenses keep 1 in N shingle hashes
+FINGERPRINT_SAMPLE_MIN = 256   # Short licenses keep every shingle hash
+FINGERPRINT_MIN_COVERAGE = 0.7 # Share of a license found in a file
+FINGERPRINT_HEAD_BYTES = 4096  # Bytes hashed with the file size before a full read
+LICENSE_FILE_PATTERN = re.compile(r"^(licen[cs]e|copying|copyright|notice|unlicense)([-_. ].*)?$", re.IGNORECASE)
+SPDX_HEADER_PATTERN = re.compile(rb"SPDX-License-Identifier:\s*([^\r\n*#]+)")
+SPDX_HEADER_SUFFIXES = {".py", ".pyi", ".toml", ".cfg", ".txt", ".md", ".rst", ".osl", ".glsl", ".c", ".h", ".cpp"}
+SPDX_HEADER_BYTES = 4096
+DETECT_SKIP_DIRS = {".git", ".hg", ".svn", "__pycache__", ".venv", "venv", "node_modules", ".mypy_cache", ".pytest_cache", ".ruff_cache", ".tox"}
+
+# Field Constraints : compiled once per key by get_field_rule()
+# char_map : typed char -> replacement | allowed : regex char class body | limit : max chars | pattern : full value check
+FIELD_CONSTRAINTS = {
+    'ID'        : {'char_map': {" ": "_", "-": "_"}, 'allowed': "A-Za-z0-9_"},
+    'TAGLINE'   : {'limit': 64},
+    'EMAIL'     : {'char_map': {" ": ""}, 'pattern': EMAIL_PATTERN},
+    'WEBSITE'   : {'char_map': {" ": ""}, 'pattern': WEBSITE_PATTERN},
+    'COPYRIGHT' : {'pattern': COPYRIGHT_PATTERN}, # YEAR[-YEAR] Name
+}
+
+# Undo
+HISTORY_MAX_STEPS = 500
+
+# Paths
+PATH_CACHE_TTL = 2.0 # Seconds a stat result is reused
+
+# Logs
+LOG_MAX_LINES = 20000            # Ring buffer slots
+LOG_MAX_BYTES = 4 * 1024 * 1024  # Evict early past this size
+LOG_SEVERITY_PATTERNS = {
+    "ERROR"   : re.compile(r"\b(error|fatal|traceback|exception)\b", re.IGNORECASE),
+    "WARNING" : re.compile(r"\bwarn(ing)?\b", re.IGNORECASE),
+}
+
+# Stall Watchdog
+WATCHDOG_THRESHOLD_MS = 200  # Heartbeat lateness that counts as a stall
+WATCHDOG_HEARTBEAT_MS = 50
+WATCHDOG_SAMPLE_MS = 20      # Stack sampling interval of the watchdog thread
+WATCHDOG_STACK_DEPTH = 8     # Innermost frames printed per stall
+WATCHDOG_BUCKETS = (2.5, 5, 12.5, 25) # Histogram edges, in multiples of the threshold
+
+# Profiler
+PROFILE_REPORT_FILE = "profile_report.txt"
+PROFILE_TOP_FUNCTIONS = 5   # cProfile entries listed per handler
+
+# Background Jobs
+EXECUTOR_WORKERS = 4
+EXECUTOR_POLL_MS = 30      # Result drain interval while jobs are out
+EXECUTOR_BATCH = 2000      # Results delivered per tick
+PRIORITY_HIGH = 0          # UI feedback : path checks
+PRIORITY_NORMAL = 1        # Loads, scans, commands
+
+# Network
+HTTP_TIMEOUT = (3.05, 10) # Connect, Read
+HTTP_POOL_SIZE = 4
+HTTP_RETRIES = 2
 
 ########################•########################
 """                  GUI HELPERS              """
@@ -270,26 +369,219 @@ class EntryPopup(Dialog):
         return popup.result
 
 
-class CharsReplacer:
-    def __init__(self, filter_map=dict()):
-        self.filter_map = filter_map
+# Compiled input constraints, usable without Tk
+class FieldRule:
+    def __init__(self, char_map={}, allowed="", limit=0, pattern=None):
+        self.table = str.maketrans(char_map) if char_map else None
+        self.rejected = re.compile(f"[^{allowed}]+") if allowed else None
+        self.limit = limit
+        self.pattern = re.compile(pattern) if isinstance(pattern, str) else pattern
+
 
     def process(self, chars=""):
-        if not chars: return ""
         if not isinstance(chars, str): return ""
-        if not self.filter_map: return chars
-        chars = "".join([self.filter_map.get(char, char) for char in chars])
+        if self.table: chars = chars.translate(self.table)
+        if self.rejected: chars = self.rejected.sub("", chars)
+        if self.limit: chars = chars[:self.limit]
         return chars
 
 
-class CharsLimiter:
-    def __init__(self, limit=64):
-        self.limit = limit
+    # Inserted text as it should land, given the value it produces
+    def fit(self, inserted="", proposed=""):
+        if self.table: inserted = inserted.translate(self.table)
+        if self.rejected: inserted = self.rejected.sub("", inserted)
+        if self.limit:
+            room = self.limit - (len(proposed) - len(inserted))
+            inserted = inserted[:max(0, room)]
+        return inserted
 
-    def process(self, chars=""):
-        if not chars: return ""
-        if not isinstance(chars, str): return ""
-        return chars[:self.limit]
+
+    def is_valid(self, value=""):
+        if not value or not self.pattern:
+            return True
+        return bool(self.pattern.match(value))
+
+
+FIELD_RULES = {}
+
+def get_field_rule(key=''):
+    if key not in FIELD_CONSTRAINTS:
+        return None
+    if key not in FIELD_RULES:
+        FIELD_RULES[key] = FieldRule(**FIELD_CONSTRAINTS[key])
+    return FIELD_RULES[key]
+
+
+# Path checks keyed by (path, mode), shared by the Tk thread and workers
+class PathCache:
+    CHECKS = {'DIR': is_dir, 'EXE': is_exe, 'FILE': is_path}
+
+    def __init__(self, ttl=PATH_CACHE_TTL):
+        self.ttl = ttl
+        self.results = {} # (Path, Mode) : (valid, checked at)
+        self.lock = threading.Lock()
+
+
+    # Cached result or None, never touches the disk
+    def get(self, path, mode='DIR'):
+        with self.lock:
+            cached = self.results.get((str(path), mode))
+        if cached and time.monotonic() - cached[1] < self.ttl:
+            return cached[0]
+        return None
+
+
+    def check(self, path, mode='DIR'):
+        valid = self.get(path, mode)
+        if valid is None:
+            valid = bool(self.CHECKS[mode](path))
+            with self.lock:
+                self.results[(str(path), mode)] = (valid, time.monotonic())
+        return valid
+
+
+PATH_CACHE = PathCache()
+
+
+class SearchIndex:
+    NORMALIZE = re.compile(r"[^a-z0-9]+")
+
+    def __init__(self, items=[], aliases={}):
+        self.size = 0
+        self.keys = []   # Per Item : normalized name + alias
+        self.words = []  # Per Item : word tokens
+        self.grams = {}  # Trigram : item indices
+        for item in items:
+            texts = [str(item)]
+            alias = aliases.get(item) if aliases else None
+            if alias:
+                texts.append(str(alias))
+            self.keys.append(())
+            self.words.append(())
+            self.index_item(self.size, texts)
+            self.size += 1
+
+
+    def index_item(self, i, texts=[]):
+        keys = tuple(self.normalize(text) for text in texts)
+        self.keys[i] = keys
+        self.words[i] = tuple(word for text in texts for word in self.NORMALIZE.split(text.lower()) if word)
+        for gram in {key[j:j + 3] for key in keys for j in range(len(key) - 2)}:
+            postings = self.grams.get(gram)
+            if postings is None:
+                self.grams[gram] = {i}
+            else:
+                postings.add(i)
+
+
+    # Emptied slots never match : no keys, no postings
+    def unindex_item(self, i):
+        for gram in {key[j:j + 3] for key in self.keys[i] for j in range(len(key) - 2)}:
+            postings = self.grams.get(gram)
+            if postings is not None:
+                postings.discard(i)
+                if not postings:
+                    del self.grams[gram]
+        self.keys[i] = ()
+        self.words[i] = ()
+
+
+    @classmethod
+    def normalize(cls, text=""):
+        return cls.NORMALIZE.sub("", text.lower())
+
+
+    def search(self, query="", within=None):
+        terms = [term for term in (self.normalize(split) for split in query.split()) if term]
+        if not terms:
+            return list(range(self.size)) if within is None else sorted(within)
+        # Candidates : narrow a previous result, then intersect trigram postings, rarest first
+        candidates = None if within is None else set(within)
+        for term in terms:
+            if len(term) < 3:
+                continue
+            grams = {term[j:j + 3] for j in range(len(term) - 2)}
+            for postings in sorted((self.grams.get(gram, set()) for gram in grams), key=len):
+                candidates = set(postings) if candidates is None else candidates & postings
+                if not candidates:
+                    return []
+        # Short Terms : verified below
+        if candidates is None:
+            candidates = range(self.size)
+        # Rank : verify + score, then shorter names first
+        ranked = []
+        for i in candidates:
+            score = 0
+            for term in terms:
+                term_score = self.__score(i, term)
+                if term_score is None:
+                    break
+                score += term_score
+            else:
+                ranked.append((score, len(self.keys[i][0]), i))
+        ranked.sort()
+        return [i for _, _, i in ranked]
+
+
+    def __score(self, i, term):
+        keys = self.keys[i]
+        if term in keys:
+            return 0
+        if any(key.startswith(term) for key in keys):
+            return 1
+        if any(word.startswith(term) for word in self.words[i]):
+            return 2
+        if any(term in key for key in keys):
+            return 3
+        return None
+
+# One index over entries from many sources, each source replaced on its own
+class PaletteIndex(SearchIndex):
+    def __init__(self):
+        super().__init__()
+        self.entries = [] # Entry id : (source, label, payload) | None once freed
+        self.sources = {} # Source : entry ids
+        self.free = []    # Freed entry ids, reused first
+
+
+    def set_source(self, source, entries=[]):
+        self.remove_source(source)
+        ids = []
+        for texts, label, payload in entries:
+            if self.free:
+                i = self.free.pop()
+            else:
+                i = self.size
+                self.keys.append(())
+                self.words.append(())
+                self.entries.append(None)
+                self.size += 1
+            self.index_item(i, texts)
+            self.entries[i] = (source, label, payload)
+            ids.append(i)
+        self.sources[source] = ids
+
+
+    def remove_source(self, source):
+        for i in self.sources.pop(source, ()):
+            self.unindex_item(i)
+            self.entries[i] = None
+            self.free.append(i)
+
+
+    def search(self, query="", limit=PALETTE_MAX_RESULTS):
+        if query.strip():
+            results = super().search(query)
+        else:
+            results = (i for i in range(self.size) if self.entries[i])
+        return [self.entries[i] for _, i in zip(range(limit), results)]
+
+
+    def __len__(self):
+        return self.size - len(self.free)
+
+
+PALETTE_INDEX = PaletteIndex()
 
 
 class COLORS:
@@ -303,6 +595,8 @@ class COLORS:
     VALID  = "#4ceb34" # Green
     ERROR  = "#E56B6F" # Red
     REQ    = "#faef28" # Yellow
+    STRING = "#1E7B34" # Dark Green
+    NUMBER = "#1B4F9C" # Dark Blue
 
 
 class RELIEF:
@@ -357,20 +651,349 @@ def config_widget(widget, required=False):
         widget.config(background=COLORS.BLACK, fg=COLORS.ERROR)
 
 
-def color_rows(listbox, selected_items=set()):
-    if isinstance(listbox, tk.Listbox):
-        for i in range(listbox.size()):
-            if listbox.get(i) in selected_items:
-                listbox.itemconfig(i, {'bg':COLORS.BG4})
-            else:
-                color = COLORS.BG1 if i % 2 == 0 else COLORS.BG2
-                listbox.itemconfig(i, {'bg':color})
+# Old Rows -> New Rows : rows to delete (old positions) and rows to insert (new positions)
+def diff_rows(old=[], new=[]):
+    position = {value: row for row, value in enumerate(old)}
+    shared = [(position[value], row) for row, value in enumerate(new) if value in position]
+    # Keep : longest run of shared rows already in order
+    tails = []
+    tails_at = []
+    links = []
+    for old_row, new_row in shared:
+        i = bisect_left(tails, old_row)
+        links.append(tails_at[i - 1] if i else -1)
+        if i == len(tails):
+            tails.append(old_row)
+            tails_at.append(len(links) - 1)
+        else:
+            tails[i] = old_row
+            tails_at[i] = len(links) - 1
+    kept_old = set()
+    kept_new = set()
+    link = tails_at[-1] if tails_at else -1
+    while link != -1:
+        kept_old.add(shared[link][0])
+        kept_new.add(shared[link][1])
+        link = links[link]
+    deletes = [row for row in range(len(old)) if row not in kept_old]
+    inserts = [(row, value) for row, value in enumerate(new) if row not in kept_new]
+    return deletes, inserts
+
+
+# Sorted Rows -> [(First, Last)]
+def row_ranges(rows=[]):
+    ranges = []
+    for row in rows:
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1][1] = row
+        else:
+            ranges.append([row, row])
+    return ranges
+
+
+# Line based TOML tokens, the only state carried between lines is an open array
+class TomlHighlighter:
+    KEY_VALUE = re.compile(r'^(\s*)([A-Za-z0-9_-]+)(\s*=\s*)(.*?)\s*$')
+    TABLE     = re.compile(r'^\s*\[[A-Za-z0-9_.-]+\]\s*$')
+    STRING    = re.compile(r'"(?:[^"\\\n]|\\.)*"')
+    NUMBER    = re.compile(r'^(true|false|[+-]?\d+(\.\d+)?)$')
+    ELEMENT   = re.compile(r'^(\s*)("(?:[^"\\\n]|\\.)*")\s*,?\s*$')
+    VALUE_CHECKS = {
+        'id'                  : lambda value: bool(re.match(r"^[A-Za-z][A-Za-z0-9_]*$", value)),
+        'type'                : lambda value: value in EXTENSION_TYPES,
+        'tagline'             : lambda value: is_string(value) and len(value) <= 64,
+        'schema_version'      : is_ver_str,
+        'version'             : is_ver_str,
+        'blender_version_min' : is_ver_str,
+        'blender_version_max' : is_ver_str,
+        'platforms'           : lambda value: value in PLATFORMS,
+        'license'             : lambda value: value.startswith("SPDX:"),
+    }
+    TAGS = {
+        'key'     : {'foreground': COLORS.BG4},
+        'table'   : {'foreground': COLORS.BG5, 'background': COLORS.BG1},
+        'string'  : {'foreground': COLORS.STRING},
+        'number'  : {'foreground': COLORS.NUMBER},
+        'bracket' : {'foreground': COLORS.BG3},
+        'comment' : {'foreground': COLORS.BG3},
+        'invalid' : {'background': COLORS.ERROR},
+    }
+
+    def __init__(self, text_widget):
+        self.text = text_widget
+        self.tokens = [] # Per Line : (tag, start, end)
+        self.ends = []   # Per Line : state after the line
+        for tag, options in self.TAGS.items():
+            self.text.tag_configure(tag, **options)
+        self.text.tag_raise('invalid')
+
+
+    def reset(self):
+        for tag in self.TAGS:
+            self.text.tag_remove(tag, 1.0, tk.END)
+        self.tokens = []
+        self.ends = []
+
+
+    # Lines [start, old_end) were replaced by lines[start:new_end]
+    def update(self, lines=[], start=0, old_end=0, new_end=0):
+        self.tokens[start:old_end] = [()] * (new_end - start)
+        self.ends[start:old_end] = [None] * (new_end - start)
+        state = self.ends[start - 1] if start else None
+        adds = {}
+        removes = {}
+        i = start
+        while i < len(lines):
+            tokens, state_out = self.tokenize(lines[i], state)
+            # Delta : fresh lines carry no tags, re-scanned lines only swap what differs
+            old_tokens = set(self.tokens[i])
+            for tag, first, last in set(tokens) - old_tokens:
+                adds.setdefault(tag, []).extend((f"{i + 1}.{first}", f"{i + 1}.{last}"))
+            for tag, first, last in old_tokens - set(tokens):
+                removes.setdefault(tag, []).extend((f"{i + 1}.{first}", f"{i + 1}.{last}"))
+            old_state = self.ends[i]
+            self.tokens[i] = tokens
+            self.ends[i] = state_out
+            state = state_out
+            i += 1
+            # Converged : an unedited line ends in the state it had before
+            if i > new_end and state_out == old_state:
+                break
+        for tag, indices in removes.items():
+            for j in range(0, len(indices), 2):
+                self.text.tag_remove(tag, indices[j], indices[j + 1])
+        for tag, indices in adds.items():
+            self.text.tag_add(tag, *indices)
+
+
+    @classmethod
+    def tokenize(cls, line="", state=None):
+        stripped = line.strip()
+        if not stripped:
+            return (), state
+        indent = len(line) - len(line.lstrip())
+        if stripped.startswith("#"):
+            return (('comment', indent, len(line)),), state
+        # Array Body
+        if state is not None:
+            if stripped.startswith("]"):
+                return (('bracket', indent, indent + 1),), None
+            match = cls.ELEMENT.match(line)
+            if not match:
+                return (('invalid', indent, len(line)),), state
+            first, last = match.span(2)
+            return ((cls.__value_tag(state, match.group(2)), first, last),), state
+        # Table
+        if cls.TABLE.match(line):
+            return (('table', indent, len(line.rstrip())),), None
+        # Key = Value
+        match = cls.KEY_VALUE.match(line)
+        if not match:
+            return (('invalid', indent, len(line)),), None
+        key = match.group(2)
+        tokens = [('key', match.start(2), match.end(2))]
+        value = match.group(4)
+        first = match.start(4)
+        if value == "[":
+            tokens.append(('bracket', first, first + 1))
+            return tuple(tokens), key
+        if value.startswith("[") and value.endswith("]"):
+            tokens.append(('bracket', first, first + 1))
+            for element in cls.STRING.finditer(value):
+                tokens.append((cls.__value_tag(key, element.group()), first + element.start(), first + element.end()))
+            tokens.append(('bracket', first + len(value) - 1, first + len(value)))
+        elif cls.STRING.fullmatch(value):
+            tokens.append((cls.__value_tag(key, value), first, first + len(value)))
+        elif cls.NUMBER.match(value):
+            tokens.append(('number', first, first + len(value)))
+        else:
+            tokens.append(('invalid', first, first + max(1, len(value))))
+        return tuple(tokens), None
+
 
+    @classmethod
+    def __value_tag(cls, key, token):
+        check = cls.VALUE_CHECKS.get(key)
+        if not check:
+            return 'string'
+        try:
+            value = json.loads(token)
+        except ValueError:
+            return 'invalid'
+        return 'string' if check(value) else 'invalid'
 
 ########################•########################
 """                  DATABASE                 """
 ########################•########################
 
+# TOML basic strings share JSON escapes, except DEL which JSON leaves raw
+def toml_string(value=""):
+    return json.dumps(str(value), ensure_ascii=False).replace("\x7f", "\\u007f")
+
+
+def toml_array(key="", values=[]):
+    if not values:
+        return []
+    return [f"{key} = ["] + [f"\t{toml_string(value)}," for value in values] + ["]"]
+
+
+def render_manifest(lines=[]):
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def is_manifest_saved(lines=[], file_path=""):
+    data = render_manifest(lines)
+    file_path = Path(file_path)
+    try:
+        return file_path.stat().st_size == len(data) and file_path.read_bytes() == data
+    except OSError:
+        return False
+
+
+# Rendered into one buffer and compared with the file : an unchanged manifest keeps its mtime
+@try_except_decorator
+def write_manifest(lines=[], file_path=""):
+    if is_manifest_saved(lines, file_path):
+        return False
+    data = render_manifest(lines)
+    file_path = Path(file_path)
+    # Atomic : watchers and Blender never see a half written manifest
+    temp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, file_path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+# One project : typed fields in slots, any number of instances per process
+# Values are immutable (lists are stored as tuples) : snapshots share them instead of copying
+class Manifest:
+    FIELDS = {
+        # ___ Paths ___ #
+        'BLENDER_EXE_PATH'    : str,
+        'SOURCE_DIR'          : str,
+        'BUILD_DIR'           : str,
+        # ___ Extension ___ #
+        'ID'                  : str,
+        'NAME'                : str,
+        'TAGLINE'             : str,
+        'TYPE'                : str,
+        'TAGS'                : tuple,
+        # ___ Versions ___ #
+        'SCHEMA_VERSION'      : tuple,
+        'VERSION'             : tuple,
+        'BLENDER_VERSION_MIN' : tuple,
+        'BLENDER_VERSION_MAX' : tuple,
+        # ___ Developer ___ #
+        'MAINTAINER'          : str,
+        'EMAIL'               : str,
+        'WEBSITE'             : str,
+        # ___ Legal ___ #
+        'LICENSE'             : tuple, # SPDX values, the picker shows names
+        'COPYRIGHT'           : tuple,
+        # ___ Platform ___ #
+        'PERMISSIONS'         : tuple, # Names, or (name, reason) pairs
+        'PLATFORMS'           : tuple,
+        # ___ Dependencies ___ #
+        'WHEELS'              : tuple,
+        'INCLUDE_PATHS'       : tuple,
+        'EXCLUDE_PATTERNS'    : tuple,
+    }
+    PATHS = ('BLENDER_EXE_PATH', 'SOURCE_DIR', 'BUILD_DIR') # Tool settings, not written to the file
+    __slots__ = tuple(FIELDS) + ('listeners',)
+
+    def __init__(self, **values):
+        self.listeners = None # Field | None for any : callbacks(key, old, new)
+        for key in self.FIELDS:
+            object.__setattr__(self, key, None)
+        for key, value in values.items():
+            setattr(self, key, value)
+
+
+    # Plain assignments go through set : listeners see every change
+    def __setattr__(self, key, value):
+        if key in self.FIELDS:
+            self.set(key, value)
+        else:
+            object.__setattr__(self, key, value)
+
+
+    def __repr__(self):
+        values = ", ".join(f"{key}={getattr(self, key)!r}" for key in self.FIELDS if getattr(self, key) is not None)
+        return f"Manifest({values})"
+
+
+    @classmethod
+    def coerce(cls, key, value):
+        kind = cls.FIELDS.get(key)
+        if kind is None:
+            raise KeyError(f"Unknown manifest field : {key}")
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            value = tuple(value.items())
+        elif isinstance(value, list):
+            value = tuple(value)
+        elif isinstance(value, Path):
+            value = str(value)
+        if not isinstance(value, kind):
+            raise TypeError(f"{key} expects {kind.__name__}, got {type(value).__name__}")
+        return value
+
+
+    def get(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(f"Unknown manifest field : {key}")
+        return getattr(self, key)
+
+
+    def set(self, key, value):
+        value = self.coerce(key, value)
+        old = getattr(self, key)
+        if old == value:
+            return False
+        object.__setattr__(self, key, value)
+        if self.listeners:
+            for callback in chain(self.listeners.get(key, ()), self.listeners.get(None, ())):
+                callback(key, old, value)
+        return True
+
+
+    def on_change(self, key=None, callback=None):
+        if key is not None and key not in self.FIELDS:
+            raise KeyError(f"Unknown manifest field : {key}")
+        if self.listeners is None:
+            self.listeners = {}
+        self.listeners.setdefault(key, []).append(callback)
+
+
+    # O(fields) references, no value is copied
+    def snapshot(self):
+        return tuple(getattr(self, key) for key in self.FIELDS)
+
+
+    def restore(self, snapshot=()):
+        for key, value in zip(self.FIELDS, snapshot):
+            self.set(key, value)
+
+
+    def copy(self):
+        clone = Manifest()
+        for key, value in zip(self.FIELDS, self.snapshot()):
+            object.__setattr__(clone, key, value)
+        return clone
+
+
+    # Fields whose values differ from another manifest or snapshot
+    def diff(self, other):
+        other = other.snapshot() if isinstance(other, Manifest) else other
+        return [key for key, value, other_value in zip(self.FIELDS, self.snapshot(), other) if value is not other_value and value != other_value]
+
+
 class DB:
     # ___ File ___ #
     MANI_FILE_NAME = "blender_manifest.toml"
@@ -379,113 +1002,777 @@ class DB:
     # ___ Commands ___ #
     VALIDATE_LINES = []
     BUILD_LINES = []
-    # ___ Paths ___ #
-    BLENDER_EXE_PATH = None
-    SOURCE_DIR = None
-    BUILD_DIR = None
-    # ___ Extension ___ #
-    ID = None
-    NAME = None
-    TAGLINE = None
-    TYPE = None
-    TAGS = None
-    # ___ Versions ___ #
-    SCHEMA_VERSION = None
-    VERSION = None
-    BLENDER_VERSION_MIN = None
-    BLENDER_VERSION_MAX = None
-    # ___ Developer ___ #
-    MAINTAINER = None
-    EMAIL = None
-    WEBSITE = None
-    # ___ Legal ___ #
-    LICENSE = None
-    COPYRIGHT = None
-    # ___ Platform ___ #
-    PERMISSIONS = None
-    PLATFORMS = None
-    # ___ Dependencies ___ #
-    WHEELS = None
-    INCLUDE_PATHS = None
-    PATHS_EXCLUDE_PATTER = None
+    # ___ Project ___ #
+    MANIFEST = Manifest()
+    # ___ Dirty Tracking ___ #
+    DIRTY = set()
+    # Section : input fields, in manifest order (tables last)
+    SECTIONS = {
+        'identity'    : ('ID', 'NAME', 'TAGLINE', 'TYPE', 'MAINTAINER', 'EMAIL', 'WEBSITE'),
+        'versions'    : ('SCHEMA_VERSION', 'VERSION', 'BLENDER_VERSION_MIN', 'BLENDER_VERSION_MAX'),
+        'tags'        : ('TAGS',),
+        'license'     : ('LICENSE', 'COPYRIGHT'),
+        'platforms'   : ('PLATFORMS',),
+        'wheels'      : ('WHEELS',),
+        'permissions' : ('PERMISSIONS',),
+        'build'       : ('INCLUDE_PATHS', 'EXCLUDE_PATTERNS'),
+    }
+    SECTION_LINES = {name: [] for name in SECTIONS}
+    VALIDATE_FIELDS = {'BLENDER_EXE_PATH', 'SOURCE_DIR'}
+    BUILD_FIELDS = {'BLENDER_EXE_PATH', 'SOURCE_DIR', 'BUILD_DIR', 'ID', 'VERSION'}
+    # ___ Counters ___ #
+    SECTION_BUILDS = 0
 
     @classmethod
     def set_value(cls, key='', val=None):
-        if hasattr(cls, key):
-            setattr(cls, key, val)
+        if cls.MANIFEST.set(key, val):
+            cls.DIRTY.add(key)
+
+    @classmethod
+    def mark_all_dirty(cls):
+        cls.DIRTY.update(field for fields in cls.SECTIONS.values() for field in fields)
+        cls.DIRTY.update(cls.VALIDATE_FIELDS | cls.BUILD_FIELDS)
+
+    @classmethod
+    def set_source_dir(cls, source_dir, valid=False):
+        # Stale : the source changed while checking
+        if source_dir != cls.MANIFEST.SOURCE_DIR:
+            return
+        cls.MANI_FILE_PATH = Path(source_dir).joinpath(cls.MANI_FILE_NAME) if valid else ""
 
     @classmethod
     def update_lines(cls):
-        cls.MANIFEST_LINES.clear()
-        cls.VALIDATE_LINES.clear()
-        cls.BUILD_LINES.clear()
+        dirty, cls.DIRTY = cls.DIRTY, set()
+        if not dirty:
+            return
+        manifest = cls.MANIFEST
+
+        # Manifest File Path : cached check, a miss is checked on a worker
+        if 'SOURCE_DIR' in dirty:
+            valid = PATH_CACHE.get(manifest.SOURCE_DIR, 'DIR') if manifest.SOURCE_DIR else False
+            if valid is None:
+                source_dir = manifest.SOURCE_DIR
+                EXECUTOR.submit(PATH_CACHE.check, source_dir, 'DIR', priority=PRIORITY_HIGH, on_done=lambda valid: cls.set_source_dir(source_dir, valid))
+            cls.set_source_dir(manifest.SOURCE_DIR, valid)
+
+        # Sections : regenerate only those reading a changed field
+        changed = False
+        for name, fields in cls.SECTIONS.items():
+            if dirty.isdisjoint(fields):
+                continue
+            cls.SECTION_LINES[name] = getattr(cls, f"section_{name}")(manifest)
+            cls.SECTION_BUILDS += 1
+            changed = True
+        if changed:
+            cls.MANIFEST_LINES[:] = chain.from_iterable(cls.SECTION_LINES.values())
+
+        # Commands
+        if not dirty.isdisjoint(cls.VALIDATE_FIELDS):
+            cls.VALIDATE_LINES[:] = cls.validate_command(manifest)
+        if not dirty.isdisjoint(cls.BUILD_FIELDS):
+            cls.BUILD_LINES[:] = cls.build_command(manifest)
+
+    # Any manifest, in one pass : batch tooling
+    @classmethod
+    def manifest_lines(cls, manifest):
+        return list(chain.from_iterable(getattr(cls, f"section_{name}")(manifest) for name in cls.SECTIONS))
+
+    # ___ Sections ___ #
+    @classmethod
+    def section_identity(cls, manifest):
+        lines = []
+        if is_string(manifest.ID):
+            lines.append(f"id = {toml_string(manifest.ID)}")
+        if is_string(manifest.NAME):
+            lines.append(f"name = {toml_string(manifest.NAME)}")
+        if is_string(manifest.TAGLINE):
+            lines.append(f"tagline = {toml_string(manifest.TAGLINE[:64])}")
+        if is_string(manifest.MAINTAINER):
+            maintainer = f"{manifest.MAINTAINER} <{manifest.EMAIL}>" if is_string(manifest.EMAIL) else manifest.MAINTAINER
+            lines.append(f"maintainer = {toml_string(maintainer)}")
+        if is_string(manifest.TYPE):
+            lines.append(f"type = {toml_string(manifest.TYPE)}")
+        if is_string(manifest.WEBSITE):
+            lines.append(f"website = {toml_string(manifest.WEBSITE)}")
+        return lines
+
+    @classmethod
+    def section_versions(cls, manifest):
+        lines = []
+        for key, value in (("schema_version", manifest.SCHEMA_VERSION), ("version", manifest.VERSION), ("blender_version_min", manifest.BLENDER_VERSION_MIN), ("blender_version_max", manifest.BLENDER_VERSION_MAX)):
+            if is_tuple(value):
+                lines.append(f"{key} = {toml_string('.'.join(str(part) for part in value))}")
+        return lines
+
+    @classmethod
+    def section_tags(cls, manifest):
+        return toml_array("tags", manifest.TAGS)
+
+    @classmethod
+    def section_license(cls, manifest):
+        return toml_array("license", manifest.LICENSE) + toml_array("copyright", manifest.COPYRIGHT)
+
+    @classmethod
+    def section_platforms(cls, manifest):
+        return toml_array("platforms", manifest.PLATFORMS)
+
+    @classmethod
+    def section_wheels(cls, manifest):
+        return toml_array("wheels", manifest.WHEELS)
+
+    @classmethod
+    def section_permissions(cls, manifest):
+        if not manifest.PERMISSIONS:
+            return []
+        # Picked names use the default reason, pairs carry their own
+        lines = ["", "[permissions]"]
+        for permission in manifest.PERMISSIONS:
+            permission, reason = permission if isinstance(permission, tuple) else (permission, PERMISSION_REASON)
+            lines.append(f"{permission} = {toml_string(reason)}")
+        return lines
+
+    @classmethod
+    def section_build(cls, manifest):
+        if manifest.INCLUDE_PATHS:
+            return ["", "[build]"] + toml_array("paths", manifest.INCLUDE_PATHS)
+        if manifest.EXCLUDE_PATTERNS:
+            return ["", "[build]"] + toml_array("paths_exclude_pattern", manifest.EXCLUDE_PATTERNS)
+        return []
+
+    # ___ Commands ___ #
+    @classmethod
+    def validate_command(cls, manifest):
+        if not manifest.BLENDER_EXE_PATH or not manifest.SOURCE_DIR:
+            return []
+        return [str(manifest.BLENDER_EXE_PATH), "--command", "extension", "validate", str(manifest.SOURCE_DIR)]
+
+    @classmethod
+    def build_command(cls, manifest):
+        if not manifest.BLENDER_EXE_PATH or not manifest.SOURCE_DIR or not manifest.BUILD_DIR:
+            return []
+        version = '.'.join(str(part) for part in manifest.VERSION) if is_tuple(manifest.VERSION) else ""
+        return [
+            str(manifest.BLENDER_EXE_PATH),
+            "--command", "extension", "build",
+            "--source-dir", str(manifest.SOURCE_DIR),
+            "--output-filepath", str(Path(manifest.BUILD_DIR).joinpath(f"{manifest.ID}-{version}.zip")),
+        ]
+
+
+MAINTAINER_PATTERN = re.compile(r"(.*?)\s*<([^<>]*)>")
+
+# Parsed TOML back into the model, fields that do not fit their type are skipped
+def parse_manifest(data={}):
+    manifest = Manifest()
+    for key, field in (("id", 'ID'), ("name", 'NAME'), ("tagline", 'TAGLINE'), ("type", 'TYPE'), ("website", 'WEBSITE')):
+        if isinstance(data.get(key), str):
+            setattr(manifest, field, data[key])
+    maintainer = data.get("maintainer")
+    if isinstance(maintainer, str):
+        match = MAINTAINER_PATTERN.fullmatch(maintainer.strip())
+        if match:
+            manifest.MAINTAINER, manifest.EMAIL = match.groups()
+        else:
+            manifest.MAINTAINER = maintainer
+    for key, field in (("schema_version", 'SCHEMA_VERSION'), ("version", 'VERSION'), ("blender_version_min", 'BLENDER_VERSION_MIN'), ("blender_version_max", 'BLENDER_VERSION_MAX')):
+        try:
+            version = tuple(int(part) for part in str(data[key]).split("."))
+        except (KeyError, ValueError):
+            continue
+        if len(version) == 3:
+            setattr(manifest, field, version)
+    build = data.get("build") if isinstance(data.get("build"), dict) else {}
+    # License : SPDX values, as the model stores them
+    for values, field in ((data.get("tags"), 'TAGS'), (data.get("license"), 'LICENSE'), (data.get("copyright"), 'COPYRIGHT'), (data.get("platforms"), 'PLATFORMS'), (data.get("wheels"), 'WHEELS'), (build.get("paths"), 'INCLUDE_PATHS'), (build.get("paths_exclude_pattern"), 'EXCLUDE_PATTERNS')):
+        if isinstance(values, list) and all(isinstance(value, str) for value in values):
+            setattr(manifest, field, values)
+    # Permissions : (name, reason) pairs, the picker shows the names
+    if isinstance(data.get("permissions"), dict):
+        manifest.PERMISSIONS = [(name, reason) for name, reason in data["permissions"].items() if isinstance(reason, str)]
+    return manifest
+
+
+SEMVER_PATTERN    = re.compile(r"(\d+)\.(\d+)\.(\d+)(-[0-9A-Za-z.-]+)?(\+[0-9A-Za-z.-]+)?")
+CONTROL_PATTERN   = re.compile(r"[\x00-\x1f\x7f]")
+
+# Same rules as "blender --command extension validate", run in process
+# Errors : [(field, message)], empty when the manifest passes
+def check_manifest(data={}, source_dir=None):
+    errors = []
+    def error(field, message):
+        errors.append((field, message))
+
+    def check_text(field, value, terse=False):
+        if not isinstance(value, str) or not value.strip():
+            return error(field, "must be a non-empty string")
+        if value != value.strip():
+            return error(field, "must not start or end with spaces")
+        if CONTROL_PATTERN.search(value):
+            return error(field, "must not contain control characters")
+        if terse:
+            if len(value) > 64:
+                return error(field, f"must be 64 characters or fewer, found {len(value)}")
+            if not value[-1].isalnum() and value[-1] not in ")]}":
+                return error(field, f"must end with a letter, a digit or a closing bracket, not \"{value[-1]}\"")
+
+    def check_strings(field, values):
+        if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+            error(field, "must be an array of strings")
+            return []
+        return values
+
+    def check_path(field, value, pattern=False):
+        if not value.strip():
+            return error(field, "must not be empty")
+        if "\\" in value:
+            return error(field, f"\"{value}\" must use forward slashes")
+        if pattern:
+            return
+        if value.startswith("/") or re.match(r"[A-Za-z]:", value):
+            return error(field, f"\"{value}\" must be relative to the source directory")
+        if ".." in value.split("/"):
+            return error(field, f"\"{value}\" must not leave the source directory")
+        if source_dir and not Path(source_dir).joinpath(value).exists():
+            return error(field, f"\"{value}\" does not exist in the source directory")
+
+    def version(field, value):
+        match = SEMVER_PATTERN.fullmatch(value) if isinstance(value, str) else None
+        if not match:
+            return error(field, f"\"{value}\" is not a semantic version (1.2.3)")
+        return tuple(int(part) for part in match.groups()[:3])
+
+    # Required
+    for field in ("schema_version", "id", "name", "version", "tagline", "maintainer", "type", "license", "blender_version_min"):
+        if field not in data:
+            error(field, "is required")
+
+    # Identity
+    if "id" in data:
+        value = data["id"]
+        if not isinstance(value, str) or not value.isidentifier():
+            error("id", "must be a valid identifier (letters, digits, underscores)")
+        elif "__" in value:
+            error("id", "must not contain double underscores")
+        elif value.startswith("_") or value.endswith("_"):
+            error("id", "must not start or end with an underscore")
+    if "name" in data:
+        check_text("name", data["name"])
+    if "tagline" in data:
+        check_text("tagline", data["tagline"], terse=True)
+    if "maintainer" in data:
+        check_text("maintainer", data["maintainer"])
+    if "website" in data:
+        if not isinstance(data["website"], str) or not data["website"].startswith(("http://", "https://")):
+            error("website", "must start with http:// or https://")
+    extension_type = data.get("type")
+    if "type" in data and extension_type not in EXTENSION_TYPES:
+        error("type", f"must be one of : {', '.join(EXTENSION_TYPES)}")
+
+    # Versions
+    if "schema_version" in data and version("schema_version", data["schema_version"]) not in (None, (1, 0, 0)):
+        error("schema_version", "must be 1.0.0")
+    if "version" in data:
+        version("version", data["version"])
+    minimum = version("blender_version_min", data["blender_version_min"]) if "blender_version_min" in data else None
+    if minimum and minimum < (4, 2, 0):
+        error("blender_version_min", "must be 4.2.0 or newer")
+    if "blender_version_max" in data:
+        maximum = version("blender_version_max", data["blender_version_max"])
+        if minimum and maximum and maximum <= minimum:
+            error("blender_version_max", "must be greater than blender_version_min")
+
+    # Lists
+    if "tags" in data:
+        allowed = {"add-on": ADDON_TAGS, "theme": THEME_TAGS}.get(extension_type)
+        for tag in check_strings("tags", data["tags"]):
+            if allowed is not None and tag not in allowed:
+                error("tags", f"\"{tag}\" is not a {extension_type} tag")
+    if "license" in data:
+        licenses = check_strings("license", data["license"])
+        if isinstance(data["license"], list) and not data["license"]:
+            error("license", "must list at least one license")
+        for value in licenses:
+            if not value.startswith("SPDX:") or not value.removeprefix("SPDX:"):
+                error("license", f"\"{value}\" must be an SPDX identifier (SPDX:GPL-3.0-or-later)")
+    if "copyright" in data:
+        for value in check_strings("copyright", data["copyright"]):
+            if not COPYRIGHT_PATTERN.fullmatch(value):
+                error("copyright", f"\"{value}\" must be \"YEAR[-YEAR] Name\"")
+    if "platforms" in data:
+        for value in check_strings("platforms", data["platforms"]):
+            if value not in PLATFORMS:
+                error("platforms", f"\"{value}\" is not one of : {', '.join(PLATFORMS)}")
+    if "wheels" in data:
+        for value in check_strings("wheels", data["wheels"]):
+            if not value.endswith(".whl"):
+                error("wheels", f"\"{value}\" must be a .whl file")
+            check_path("wheels", value)
+
+    # Permissions : permission = reason
+    if "permissions" in data:
+        permissions = data["permissions"]
+        if not isinstance(permissions, dict):
+            error("permissions", "must be a table of permission = \"reason\"")
+            permissions = {}
+        for permission, reason in permissions.items():
+            if permission not in PERMISSIONS:
+                error("permissions", f"\"{permission}\" is not one of : {', '.join(PERMISSIONS)}")
+            check_text(f"permissions.{permission}", reason, terse=True)
+
+    # Build : source relative paths or exclude patterns
+    if "build" in data:
+        build = data["build"] if isinstance(data["build"], dict) else {}
+        if not isinstance(data["build"], dict):
+            error("build", "must be a table")
+        if "paths" in build and "paths_exclude_pattern" in build:
+            error("build", "paths and paths_exclude_pattern are mutually exclusive")
+        for value in check_strings("build.paths", build["paths"]) if "paths" in build else ():
+            check_path("build.paths", value)
+        for value in check_strings("build.paths_exclude_pattern", build["paths_exclude_pattern"]) if "paths_exclude_pattern" in build else ():
+            check_path("build.paths_exclude_pattern", value, pattern=True)
+    return errors
+
+
+def check_manifest_lines(lines=[], source_dir=None):
+    import tomllib
+    try:
+        data = tomllib.loads("\n".join(lines))
+    except ValueError as e:
+        return [("manifest", f"is not valid TOML : {e}")]
+    return check_manifest(data, source_dir=source_dir)
+
+
+def check_manifest_file(file_path, source_dir=None):
+    import tomllib
+    try:
+        with open(file_path, "rb") as file:
+            data = tomllib.load(file)
+    except OSError as e:
+        return [("manifest", f"cannot be read : {e}")]
+    except ValueError as e:
+        return [("manifest", f"is not valid TOML : {e}")]
+    return check_manifest(data, source_dir=source_dir)
+
+
+# Path : ((mtime_ns, size), Manifest), reparsed only when the file changed
+# Cached manifests are shared : copy() before editing one
+class ManifestCache:
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.parses = 0
+
+
+    def load(self, file_path):
+        file_path = str(file_path)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            entry = self.entries.get(file_path)
+        if entry and entry[0] == key:
+            return file_path, key, entry[1]
+        import tomllib
+        try:
+            with open(file_path, "rb") as file:
+                manifest = parse_manifest(tomllib.load(file))
+        except (OSError, ValueError) as e:
+            print(f"Manifest not loaded : {file_path} : {e}")
+            return None
+        with self.lock:
+            self.entries[file_path] = (key, manifest)
+            self.parses += 1
+        return file_path, key, manifest
+
+
+MANIFEST_CACHE = ManifestCache()
+
+# Coalesces widget updates : fields are marked dirty, then flushed once per idle tick
+class UpdateScheduler:
+    PENDING = {} # Widget : None, in first marked order
+    SCHEDULED = False
+    LISTENERS = [] # Called after DB lines were regenerated
+    # ___ Counters ___ #
+    MARKED = 0
+    COALESCED = 0
+    FLUSHES = 0
+
+    @classmethod
+    def mark(cls, widget):
+        if widget in cls.PENDING:
+            cls.COALESCED += 1
+        cls.PENDING[widget] = None
+        cls.MARKED += 1
+        if not cls.SCHEDULED:
+            cls.SCHEDULED = True
+            widget.parent.after_idle(cls.flush)
+
+    # Replaced by the profiler to time each callback
+    @staticmethod
+    def run_callback(callback, value):
+        callback(value)
+
+    @classmethod
+    def flush(cls):
+        cls.SCHEDULED = False
+        pending, cls.PENDING = cls.PENDING, {}
+        dirty = False
+        for widget in pending:
+            # Read once at flush time : the latest keystroke is already applied
+            value = widget.get_value()
+            for callback in widget.callbacks:
+                if callable(callback):
+                    cls.run_callback(callback, value)
+            if widget.key in Manifest.FIELDS:
+                History.record(widget.key, value)
+                DB.set_value(key=widget.key, val=value)
+                dirty = True
+        History.commit()
+        if dirty:
+            DB.update_lines()
+            for listener in cls.LISTENERS:
+                listener()
+        cls.FLUSHES += 1
+
+# Undo / Redo : a step holds only the fields it changed, as frozen values
+# Unchanged fields are never copied, a step's "before" is the previous step's "after"
+class History:
+    UNDO = deque(maxlen=HISTORY_MAX_STEPS) # Steps : ((key, before, after), ...)
+    REDO = []
+    FROZEN = {}  # Key : frozen value the form currently holds
+    WIDGETS = {} # Key : widget restored values are pushed to
+    STEP = {}    # Key : (before, after) of the flush in progress
+
+    # Baseline : the widget's initial value is not an undoable change
+    @classmethod
+    def track(cls, widget):
+        cls.WIDGETS[widget.key] = widget
+        # Lazy tabs : a widget built after a load shows the loaded value
+        value = DB.MANIFEST.get(widget.key)
+        if value is not None:
+            widget.set_value(value)
+        value = Manifest.coerce(widget.key, widget.get_value())
+        cls.FROZEN[widget.key] = value
+        # The form shows it : the manifest holds it too
+        if DB.MANIFEST.get(widget.key) != value:
+            DB.set_value(key=widget.key, val=value)
+            UpdateScheduler.mark(widget)
+
+    @classmethod
+    def record(cls, key, value):
+        before = cls.FROZEN.get(key, DB.MANIFEST.get(key))
+        after = Manifest.coerce(key, value)
+        if before == after:
+            return
+        # First change of a key in this flush keeps its original "before"
+        cls.STEP[key] = (cls.STEP[key][0] if key in cls.STEP else before, after)
+        cls.FROZEN[key] = after
+
+    @classmethod
+    def commit(cls):
+        if not cls.STEP:
+            return
+        step = tuple((key, before, after) for key, (before, after) in cls.STEP.items() if before != after)
+        cls.STEP = {}
+        if step:
+            cls.UNDO.append(step)
+            cls.REDO.clear()
+
+    @classmethod
+    def undo(cls):
+        # A pending edit becomes its own step first
+        if UpdateScheduler.PENDING:
+            UpdateScheduler.flush()
+        if not cls.UNDO:
+            return False
+        step = cls.UNDO.pop()
+        cls.REDO.append(step)
+        cls.restore((key, before) for key, before, _ in step)
+        return True
+
+    @classmethod
+    def redo(cls):
+        if UpdateScheduler.PENDING:
+            UpdateScheduler.flush()
+        if not cls.REDO:
+            return False
+        step = cls.REDO.pop()
+        cls.UNDO.append(step)
+        cls.restore((key, after) for key, _, after in step)
+        return True
+
+    # One pass : DB first, then widgets, then a single scheduled flush for callbacks and previews
+    @classmethod
+    def restore(cls, values=[]):
+        for key, value in values:
+            value = cls.push(key, value)
+            cls.FROZEN[key] = value
+            DB.set_value(key=key, val=value)
+
+    # External values (a loaded manifest) : one undoable step of what the widgets read back
+    @classmethod
+    def apply(cls, values=[]):
+        if UpdateScheduler.PENDING:
+            UpdateScheduler.flush()
+        for key, value in values:
+            value = cls.push(key, Manifest.coerce(key, value))
+            cls.record(key, value)
+            DB.set_value(key=key, val=value)
+        cls.commit()
+
+    # As the widget holds it : undo / redo restore exactly what the DB stores
+    @classmethod
+    def push(cls, key, value):
+        widget = cls.WIDGETS.get(key)
+        if not widget:
+            return value
+        widget.set_value(value)
+        UpdateScheduler.mark(widget)
+        return Manifest.coerce(key, widget.get_value())
+
+# Command output : bounded by line count and size, indexed by severity
+class LogBuffer:
+    SEVERITIES = ("ERROR", "WARNING", "INFO")
+
+    def __init__(self, max_lines=LOG_MAX_LINES, max_bytes=LOG_MAX_BYTES):
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.slots = [None] * max_lines # Sequence % max_lines : (severity, line, size)
+        self.first = 0 # Oldest sequence kept
+        self.next = 0  # Next sequence
+        self.bytes = 0
+        self.index = {severity: deque() for severity in self.SEVERITIES} # Severity : sequences, oldest first
+
+
+    def __len__(self):
+        return self.next - self.first
 
-        # Manifest File Path
-        if is_path(cls.SOURCE_DIR):
-            cls.MANI_FILE_PATH = Path.joinpath(cls.SOURCE_DIR, cls.MANI_FILE_NAME)
+
+    @staticmethod
+    def classify(line=""):
+        for severity, pattern in LOG_SEVERITY_PATTERNS.items():
+            if pattern.search(line):
+                return severity
+        return "INFO"
+
+
+    def append(self, lines=[]):
+        start = self.next
+        for line in lines:
+            # Full : the slot being reused holds the oldest line
+            if self.next - self.first == self.max_lines:
+                self.__evict()
+            severity = self.classify(line)
+            size = len(line.encode("utf-8", "replace")) + 1
+            self.slots[self.next % self.max_lines] = (severity, line, size)
+            self.index[severity].append(self.next)
+            self.bytes += size
+            self.next += 1
+        while self.bytes > self.max_bytes and self.next - self.first > 1:
+            self.__evict()
+        return range(max(start, self.first), self.next)
+
+
+    def clear(self):
+        self.slots = [None] * self.max_lines
+        self.first = self.next
+        self.bytes = 0
+        for sequences in self.index.values():
+            sequences.clear()
+
+
+    def get(self, sequence):
+        return self.slots[sequence % self.max_lines]
+
+
+    def counts(self):
+        return {severity: len(sequences) for severity, sequences in self.index.items()}
+
+
+    # Severity : from the index, Text : case-insensitive substring
+    def find(self, severity=None, text=""):
+        sequences = self.index[severity] if severity in self.index else range(self.first, self.next)
+        if not text:
+            return list(sequences)
+        text = text.casefold()
+        return [sequence for sequence in sequences if text in self.get(sequence)[1].casefold()]
+
+
+    def __evict(self):
+        severity, _, size = self.slots[self.first % self.max_lines]
+        self.slots[self.first % self.max_lines] = None
+        self.index[severity].popleft()
+        self.bytes -= size
+        self.first += 1
+
+
+########################•########################
+"""                  WORKERS                  """
+########################•########################
+
+# Handle for one submitted job : cancellation token + progress channel
+class Job:
+    def __init__(self, executor, func, args=(), priority=PRIORITY_NORMAL, on_done=None, on_progress=None):
+        self.executor = executor
+        self.func = func
+        self.args = args
+        self.priority = priority
+        self.on_done = on_done
+        self.on_progress = on_progress
+        self.cancelled = False
+        self.process = None # Child process, killed on cancel
+        self.submitted = time.perf_counter()
+        self.started = None
+
+
+    def cancel(self):
+        self.cancelled = True
+        # Blocked on its output : the worker only sees the flag once the process is gone
+        if self.process:
+            kill_process(self.process)
+
+
+    # Worker side : delivered to on_progress on the Tk thread, batched per tick
+    def progress(self, value=None):
+        if not self.cancelled:
+            self.executor.results.put(('progress', self, value))
+
+
+JOB_LOCAL = threading.local()
+
+def current_job():
+    return getattr(JOB_LOCAL, 'job', None)
+
+
+# Shared worker pool, callbacks only ever run on the Tk thread
+class Executor:
+    def __init__(self, workers=EXECUTOR_WORKERS):
+        self.workers = workers
+        self.threads = []
+        self.jobs = queue.PriorityQueue() # (Priority, Order, Job)
+        self.results = queue.Queue()      # (Kind, Job, Value)
+        self.order = count()
+        self.root = None
+        self.outstanding = 0 # Submitted, result not yet delivered
+        self.polling = False
+        self.lock = threading.Lock()
+        # ___ Counters ___ #
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.run_total = 0.0
+        self.run_max = 0.0
+        self.timed = 0
+
+
+    def attach(self, root):
+        self.root = root
+
+
+    def submit(self, func, *args, priority=PRIORITY_NORMAL, on_done=None, on_progress=None):
+        job = Job(self, func, args=args, priority=priority, on_done=on_done, on_progress=on_progress)
+        with self.lock:
+            if len(self.threads) < self.workers:
+                thread = threading.Thread(target=self.__worker, daemon=True)
+                self.threads.append(thread)
+                thread.start()
+            self.outstanding += 1
+            self.submitted += 1
+        self.jobs.put((priority, next(self.order), job))
+        if self.root and not self.polling:
+            self.polling = True
+            self.root.after(EXECUTOR_POLL_MS, self.__poll)
+        return job
+
+
+    def stats(self):
+        timed = max(1, self.timed)
+        return {
+            'queued'      : self.jobs.qsize(),
+            'outstanding' : self.outstanding,
+            'submitted'   : self.submitted,
+            'completed'   : self.completed,
+            'failed'      : self.failed,
+            'cancelled'   : self.cancelled,
+            'wait_avg_ms' : self.wait_total / timed * 1000,
+            'wait_max_ms' : self.wait_max * 1000,
+            'run_avg_ms'  : self.run_total / timed * 1000,
+            'run_max_ms'  : self.run_max * 1000,
+        }
+
+
+    def __worker(self):
+        while True:
+            _, _, job = self.jobs.get()
+            if job.cancelled:
+                self.results.put(('cancelled', job, None))
+                continue
+            job.started = time.perf_counter()
+            JOB_LOCAL.job = job
+            try:
+                self.results.put(('done', job, job.func(*job.args)))
+            except Exception:
+                print(f"ERROR : {getattr(job.func, '__name__', job.func)}()")
+                traceback.print_exc()
+                self.results.put(('failed', job, None))
+            finally:
+                JOB_LOCAL.job = None
+
+
+    def __poll(self):
+        progress = {} # Job : values, in arrival order
+        finished = []
+        for _ in range(EXECUTOR_BATCH):
+            try:
+                kind, job, value = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                progress.setdefault(job, []).append(value)
+            else:
+                finished.append((kind, job, value))
+        # Deliver : progress first so it lands before the job's result
+        for job, values in progress.items():
+            if not job.cancelled and callable(job.on_progress):
+                job.on_progress(values)
+        for kind, job, value in finished:
+            self.__finish(kind, job, value)
+        if self.outstanding:
+            self.root.after(EXECUTOR_POLL_MS, self.__poll)
         else:
-            cls.MANI_FILE_PATH = ""
-
-        # # Write File Content
-        # write(f'schema_version = "{DB.MANI_SCHEMA_VER}"\n')
-        # if DB.validate_attribute(attr='DEV_EMAIL'):
-        #     write(f'maintainer = {DB.DEV_AUTHOR} <{DB.DEV_EMAIL}>\n')
-        # else:
-        #     write(f'maintainer = {DB.DEV_AUTHOR}\n')
-        # write(f'id = "{DB.EXT_ID}"\n')
-        # write(f'type = "{DB.EXT_TYPE}"\n')
-        # write(f'name = "{DB.EXT_NAME}"\n')
-        # write(f'version = "{DB.EXT_VERSION}"\n')
-        # write(f'tagline = "{DB.EXT_TAG_LINE[:64]}"\n')
-        # if DB.validate_attributes(attrs=['EXT_ADDON_TAGS', 'EXT_THEME_TAGS']):
-        #     tags = DB.EXT_ADDON_TAGS if DB.EXT_TYPE == 'add-on' else DB.EXT_THEME_TAGS
-        #     write("tags = [\n")
-        #     for item in tags:
-        #         write(f'\t"{item}",\n')
-        #     write("]\n")
-        # if DB.validate_attribute(attr='EXT_WEBSITE'):
-        #     add(f'website = "{DB.EXT_WEBSITE}"')
-        # write("license = [\n")
-        # for item in DB.EXT_LICENSES:
-        #     write(f'\t"{item}",\n')
-        # write("]\n")
-        # if DB.EXT_COPYRIGHT and DB.validate_attribute(attr='EXT_COPYRIGHT'):
-        #     write("copyright = [\n")
-        #     for item in DB.EXT_COPYRIGHT:
-        #         write(f'\t"{item}",\n')
-        #     write("]\n")
-        # write(f'blender_version_min = "{DB.BLENDER_VER_MIN}"\n')
-        # if DB.validate_attribute(attr='BLENDER_VER_MAX'):
-        #     write(f'blender_version_max = "{DB.BLENDER_VER_MAX}"\n')
-        # if any(bool(reason_msg) for reason_msg in DB.EXT_PERMISSIONS.values()):
-        #     write('[permissions]\n')
-        #     for permission_type, reason_msg in DB.EXT_PERMISSIONS.items():
-        #         if reason_msg:
-        #             write(f'{permission_type} = "{reason_msg}"\n')
-        # if DB.EXT_PLATFORMS and DB.validate_attribute(attr='EXT_PLATFORMS'):
-        #     write("platforms = [\n")
-        #     for item in DB.EXT_PLATFORMS:
-        #         write(f'\t"{item}",\n')
-        #     write("]\n")
-        # if DB.EXT_WHEELS and DB.validate_attribute(attr='EXT_WHEELS'):
-        #     write("wheels = [\n")
-        #     for item in DB.EXT_WHEELS:
-        #         write(f'\t"{item}",\n')
-        #     write("]\n")
-        # if DB.EXT_PATH_INCLUDES and DB.validate_attribute(attr='EXT_PATH_INCLUDES'):
-        #     write("[build]")
-        #     write("paths = [\n")
-        #     for item in DB.EXT_PATH_INCLUDES:
-        #         write(f'\t"{item}",\n')
-        #     write("]\n")
-        # elif DB.EXT_PATH_EXCLUDES and DB.validate_attribute(attr='EXT_PATH_EXCLUDES'):
-        #     write("[build]")
-        #     write("paths_exclude_pattern = [\n")
-        #     for item in DB.EXT_PATH_EXCLUDES:
-        #         write(f'\t"{item}",\n')
-        #     write("]\n")
+            self.polling = False
+
+
+    def __finish(self, kind, job, value):
+        self.outstanding -= 1
+        now = time.perf_counter()
+        if job.started is not None:
+            wait = job.started - job.submitted
+            run = now - job.started
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            self.run_total += run
+            self.run_max = max(self.run_max, run)
+            self.timed += 1
+        if kind == 'cancelled' or job.cancelled:
+            self.cancelled += 1
+            return
+        if kind == 'failed':
+            self.failed += 1
+        else:
+            self.completed += 1
+        # Failed jobs deliver None so owners can reset
+        if callable(job.on_done):
+            job.on_done(value)
 
 
+EXECUTOR = Executor()
+
 ########################•########################
 """                  WIDGETS                  """
 ########################•########################
@@ -498,18 +1785,250 @@ class Base:
         self.callbacks = []
 
 
-    def invoke_update(self, value=None):
-        for callback in self.callbacks:
-            if callable(callback):
-                callback(value)
-        DB.set_value(key=self.key, val=value)
-        DB.update_lines()
+    def invoke_update(self):
+        # Nothing listens (previews) : no flush is scheduled
+        if self.key or self.callbacks:
+            UpdateScheduler.mark(self)
+
+
+    # Command Palette : the field itself, list widgets add one entry per item
+    def palette_entries(self):
+        label = self.label.cget("text")
+        return [((label,), label, None)]
+
+
+    # Undo : the initial value is the baseline, restored values come back through set_value
+    def track(self):
+        if self.key:
+            History.track(self)
+
+
+    def reindex(self):
+        if self.key and hasattr(self, 'label'):
+            PALETTE_INDEX.set_source(self, self.palette_entries())
+
+
+    def palette_jump(self, index=None):
+        # Tab frames are notebook pages
+        notebook = self.parent.master
+        if isinstance(notebook, ttk.Notebook):
+            notebook.select(self.parent)
+        target = getattr(self, 'entry', None) or getattr(self, 'frame', None)
+        if target:
+            target.focus_set()
+
+
+# Renders only the visible rows of a model : items, view (row -> item index), selected (item indices)
+class VirtualList:
+    def __init__(self, parent, multiple=False, height=6, on_select=None, on_activate=None):
+        # Props
+        self.items = []
+        self.view = []
+        self.selected = set()
+        self.multiple = multiple
+        self.on_select = on_select
+        self.on_activate = on_activate
+        self.top = 0
+        self.rows = height
+        self.window = [] # Rendered row : item index
+        self.window_rows = {} # Item index : rendered row
+        self.line_height = 0
+        self.placeholder = ""
+
+        # Widgets
+        self.listbox   = tk.Listbox(parent, height=height, exportselection=0, activestyle=tk.NONE, selectbackground=COLORS.BG4, selectforeground=COLORS.WHITE)
+        self.scrollbar = tk.Scrollbar(parent, orient=tk.VERTICAL, command=self.yview)
+
+        # Binds : native selection and scrolling are bypassed
+        self.listbox.bind("<Button-1>", self.__click_callback)
+        self.listbox.bind("<Double-Button-1>", self.__double_click_callback)
+        self.listbox.bind("<B1-Motion>", lambda event: "break")
+        self.listbox.bind("<MouseWheel>", self.__wheel_callback)
+        self.listbox.bind("<Button-4>", self.__wheel_callback)
+        self.listbox.bind("<Button-5>", self.__wheel_callback)
+        self.listbox.bind("<Up>", lambda event: self.scroll_to(self.top - 1))
+        self.listbox.bind("<Down>", lambda event: self.scroll_to(self.top + 1))
+        self.listbox.bind("<Prior>", lambda event: self.scroll_to(self.top - self.rows))
+        self.listbox.bind("<Next>", lambda event: self.scroll_to(self.top + self.rows))
+        self.listbox.bind("<Home>", lambda event: self.scroll_to(0))
+        self.listbox.bind("<End>", lambda event: self.scroll_to(len(self.view)))
+        self.listbox.bind("<Configure>", self.__configure_callback)
+
+
+    def set_items(self, items=[], view=None):
+        self.items = list(items)
+        self.view = list(range(len(self.items))) if view is None else list(view)
+        self.selected = set()
+        self.placeholder = ""
+        self.top = 0
+        self.redraw()
+
+
+    def set_view(self, view=[]):
+        self.view = view
+        self.top = 0
+        self.render()
+
+
+    def set_placeholder(self, text=""):
+        self.items = []
+        self.view = []
+        self.selected = set()
+        self.placeholder = text
+        self.top = 0
+        self.window = []
+        self.window_rows = {}
+        self.listbox.delete(0, tk.END)
+        self.listbox.insert(tk.END, text)
+        self.listbox.itemconfig(0, {'bg':COLORS.BG1, 'fg':COLORS.BG3})
+        self.update_scrollbar()
+
+
+    # O(changed) : only rows whose state flipped are recolored
+    def set_selected(self, indices=set(), state=True):
+        changed = indices - self.selected if state else indices & self.selected
+        if state:
+            self.selected |= changed
+        else:
+            self.selected -= changed
+        self.color_rows([self.window_rows[i] for i in changed if i in self.window_rows])
+        return changed
+
+
+    def toggle(self, index):
+        return self.set_selected({index}, state=index not in self.selected)
+
+
+    def clear_selection(self):
+        return self.set_selected(set(self.selected), state=False)
+
+
+    def get_selected(self):
+        return sorted(self.selected)
+
+
+    def redraw(self):
+        self.window = []
+        self.window_rows = {}
+        self.listbox.delete(0, tk.END)
+        self.render()
+
+
+    def render(self):
+        if self.placeholder:
+            return
+        self.top = max(0, min(self.top, len(self.view) - self.rows))
+        window = self.view[self.top:self.top + self.rows]
+        # Window : apply only the rows that scrolled or filtered in / out
+        deletes, inserts = diff_rows(old=self.window, new=window)
+        for first, last in reversed(row_ranges(deletes)):
+            self.listbox.delete(first, last)
+        inserted = dict(inserts)
+        for first, last in row_ranges(list(inserted.keys())):
+            self.listbox.insert(first, *(self.items[inserted[row]] for row in range(first, last + 1)))
+        self.window = window
+        self.window_rows = {i: row for row, i in enumerate(window)}
+        self.color_rows(inserted.keys())
+        self.update_scrollbar()
+
+
+    # Striped by item index so rows keep their color when others scroll in or out
+    def color_rows(self, rows=[]):
+        for row in rows:
+            i = self.window[row]
+            if i in self.selected:
+                self.listbox.itemconfig(row, {'bg':COLORS.BG4, 'fg':COLORS.WHITE})
+            else:
+                color = COLORS.BG1 if i % 2 == 0 else COLORS.BG2
+                self.listbox.itemconfig(row, {'bg':color, 'fg':COLORS.BLACK})
+
+
+    def reveal(self, index):
+        if index in self.window_rows or index not in self.view:
+            return
+        self.scroll_to(self.view.index(index) - self.rows // 2)
+
+
+    def update_scrollbar(self):
+        total = len(self.view)
+        if total <= self.rows:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.top / total, (self.top + self.rows) / total)
+
+
+    def scroll_to(self, top=0):
+        top = max(0, min(top, len(self.view) - self.rows))
+        if top != self.top:
+            self.top = top
+            self.render()
+        return "break"
+
+
+    def yview(self, *args):
+        if args[0] == tk.MOVETO:
+            self.scroll_to(round(float(args[1]) * len(self.view)))
+        elif args[0] == tk.SCROLL:
+            step = int(args[1])
+            self.scroll_to(self.top + (step * self.rows if args[2] == tk.PAGES else step))
+
+
+    def __configure_callback(self, event=None):
+        if not self.line_height:
+            # Tk listbox rows are one pixel taller than the font linespace
+            self.line_height = tkfont.Font(font=self.listbox.cget("font")).metrics("linespace") + 1
+        inset = 2 * (int(self.listbox.cget("borderwidth")) + int(self.listbox.cget("highlightthickness")))
+        rows = max(1, (event.height - inset) // self.line_height)
+        if rows != self.rows:
+            self.rows = rows
+            self.render()
+
+
+    def __wheel_callback(self, event=None):
+        up = event.num == 4 or event.delta > 0
+        return self.scroll_to(self.top + (-LIST_WHEEL_ROWS if up else LIST_WHEEL_ROWS))
+
+
+    def __row_index(self, event=None):
+        if not self.window:
+            return None
+        row = self.listbox.nearest(event.y)
+        bbox = self.listbox.bbox(row)
+        if not bbox or event.y > bbox[1] + bbox[3]:
+            return None
+        return self.window[row]
+
+
+    def __click_callback(self, event=None):
+        self.listbox.focus_set()
+        i = self.__row_index(event)
+        if i is None:
+            return "break"
+        if self.multiple:
+            self.toggle(i)
+        else:
+            self.set_selected(self.selected - {i}, state=False)
+            self.set_selected({i})
+        if callable(self.on_select):
+            self.on_select(i)
+        return "break"
+
+
+    def __double_click_callback(self, event=None):
+        if not callable(self.on_activate):
+            return self.__click_callback(event)
+        i = self.__row_index(event)
+        if i is not None:
+            self.on_activate(i)
+        return "break"
 
 
 class TabsWidget:
-    def __init__(self, frame, row=0, column=0, tab_names=[]):
+    def __init__(self, frame, row=0, column=0, tab_names=[], builders={}, lazy=False):
         self.frame = frame
         self.tabs = {}
+        self.builders = builders
+        self.built = set()
 
         # Notebook
         self.notebook = ttk.Notebook(self.frame)
@@ -523,10 +2042,47 @@ class TabsWidget:
             self.notebook.add(tab_frame, text=tab_name)
             self.tabs[tab_name] = tab_frame
 
+        # Bind
+        self.notebook.bind("<<NotebookTabChanged>>", self.__tab_changed_callback)
+
+        # Init
+        if lazy:
+            if tab_names:
+                self.build_tab(tab_name=tab_names[0])
+        else:
+            self.build_all()
+
 
     def get_tab_frame(self, tab_name=""):
         return self.tabs.get(tab_name, None)
 
+
+    def build_tab(self, tab_name=""):
+        if tab_name in self.built or tab_name not in self.tabs:
+            return False
+        self.built.add(tab_name)
+        builder = self.builders.get(tab_name)
+        if callable(builder):
+            builder(self.tabs[tab_name])
+        return True
+
+
+    def build_next(self):
+        for tab_name in self.tabs:
+            if self.build_tab(tab_name=tab_name):
+                return True
+        return False
+
+
+    def build_all(self):
+        while self.build_next():
+            pass
+
+
+    def __tab_changed_callback(self, event=None):
+        tab_name = self.notebook.tab(self.notebook.select(), "text")
+        self.build_tab(tab_name=tab_name)
+
 # BLENDER_EXE_PATH | SOURCE_DIR | BUILD_DIR
 class FolderPickerWidget(Base):
     def __init__(self, parent, key='', required=False, row=0, column=0, label_text="Select Path", pick_mode='DIR'):
@@ -534,6 +2090,7 @@ class FolderPickerWidget(Base):
 
         # Props
         self.pick_mode = pick_mode
+        self.check_job = None
 
         # Frame
         self.frame = tk.Frame(self.parent)
@@ -567,27 +2124,47 @@ class FolderPickerWidget(Base):
 
         # Init
         self.__entry_callback()
+        self.reindex()
+        self.track()
 
 
     def get_value(self):
         return self.entry.get()
 
 
+    def set_value(self, value=""):
+        self.entry.delete(0, tk.END)
+        self.entry.insert(0, value or "")
+        self.__entry_callback()
+
+
     def __entry_callback(self, event=None):
         value = self.get_value()
+        # Stale : the entry changed while checking
+        if self.check_job:
+            self.check_job.cancel()
+            self.check_job = None
         if not value:
-            self.entry.config(highlightthickness=2, highlightbackground=COLORS.WHITE, highlightcolor=COLORS.WHITE, relief=RELIEF.SOLID)
+            self.__set_highlight(COLORS.WHITE)
             return
-        valid = False
-        if self.pick_mode == 'DIR': valid = is_dir(value)
-        elif self.pick_mode == 'EXE': valid = is_exe(value)
-        elif self.pick_mode == 'FILE': valid = is_path(value)
-        if valid:
-            self.entry.config(highlightthickness=2, highlightbackground=COLORS.VALID, highlightcolor=COLORS.VALID, relief=RELIEF.SOLID)
-        else:
-            self.entry.config(highlightthickness=2, highlightbackground=COLORS.ERROR, highlightcolor=COLORS.ERROR, relief=RELIEF.SOLID)
+        # Cached : no disk access
+        valid = PATH_CACHE.get(value, self.pick_mode)
+        if valid is not None:
+            self.__apply_check(valid)
+            return
+        # Pending : stat on a worker, slow mounts never block the UI
+        self.__set_highlight(COLORS.REQ)
+        self.check_job = EXECUTOR.submit(PATH_CACHE.check, value, self.pick_mode, priority=PRIORITY_HIGH, on_done=self.__apply_check)
+
+
+    def __apply_check(self, valid=False):
+        self.__set_highlight(COLORS.VALID if valid else COLORS.ERROR)
         # Base
-        self.invoke_update(value=self.get_value())
+        self.invoke_update()
+
+
+    def __set_highlight(self, color):
+        self.entry.config(highlightthickness=2, highlightbackground=color, highlightcolor=color, relief=RELIEF.SOLID)
 
 
     def __browse_command(self):
@@ -595,7 +2172,6 @@ class FolderPickerWidget(Base):
         # Folder
         if self.pick_mode == 'DIR':
             value = filedialog.askdirectory()
-            value = value if is_dir(value) else None
         # Exe
         elif self.pick_mode == 'EXE':
             filetypes = []
@@ -603,12 +2179,10 @@ class FolderPickerWidget(Base):
                 filetypes.append(("Executable files", "*.exe"))
             filetypes.append(("All files", "*.*"))
             value = filedialog.askopenfilename(title="Select Executable", filetypes=filetypes)
-            value = value if is_exe(value) else None
         # File
         elif self.pick_mode == 'FILE':
             filetypes = [("All files", "*.*")]
             value = filedialog.askopenfilename(title="Select Executable", filetypes=filetypes)
-            value = value if is_path(value) else None
         # Assign
         if value:
             self.entry.delete(0, tk.END)
@@ -618,11 +2192,11 @@ class FolderPickerWidget(Base):
 
 # ID | NAME | TAGLINE | MAINTAINER | EMAIL | WEBSITE
 class EntryWidget(Base):
-    def __init__(self, parent, key='', required=False, row=0, column=0, label_text="Entry", char_modifiers=[]):
+    def __init__(self, parent, key='', required=False, row=0, column=0, label_text="Entry"):
         super().__init__(parent, key=key, required=required)
 
         # Props
-        self.char_modifiers = char_modifiers
+        self.rule = get_field_rule(key)
 
         # Frame
         self.frame = tk.Frame(self.parent)
@@ -641,31 +2215,48 @@ class EntryWidget(Base):
         self.label.grid(row=0, column=0, sticky="w", padx=PADX)
         self.entry.grid(row=0, column=1, sticky="we", padx=PADX)
 
-        # Bind
-        self.entry.bind("<FocusOut>", self.entry_callback)
-        self.entry.bind("<Return>", self.entry_callback)
-        self.entry.bind("<KeyPress>", self.entry_callback)
+        # Validate : every edit, typed or pasted, passes the compiled rule
+        validate_cmd = self.entry.register(self.__validate_command)
+        self.entry.config(validate="key", validatecommand=(validate_cmd, "%d", "%i", "%S", "%P"))
 
         # Config
         config_widget(self.frame)
         config_widget(self.label, self.required)
         config_widget(self.entry)
 
+        # Init
+        self.reindex()
+        self.track()
+
 
     def get_value(self):
         return self.entry.get()
 
 
-    def entry_callback(self, event):
-        value = self.get_value()
-        if self.char_modifiers:
-            for modifier in self.char_modifiers:
-                if isinstance(modifier, (CharsReplacer, CharsLimiter)):
-                    value = modifier.process(chars=value)
-                    self.entry.delete(0, tk.END)
-                    self.entry.insert(0, value)
+    def set_value(self, value=""):
+        self.entry.delete(0, tk.END)
+        self.entry.insert(0, value or "")
+
+
+    def __validate_command(self, action, index, inserted, proposed):
+        # Insert : rewrite only the inserted fragment when the rule changes it
+        if action == "1" and self.rule:
+            fitted = self.rule.fit(inserted=inserted, proposed=proposed)
+            if fitted != inserted:
+                if fitted:
+                    self.entry.after_idle(self.__insert_fitted, int(index), fitted)
+                return False
+        if self.rule and self.rule.pattern:
+            color = COLORS.BG1 if self.rule.is_valid(proposed) else COLORS.ERROR
+            self.entry.config(highlightbackground=color, highlightcolor=color)
         # Base
-        self.invoke_update(value=self.get_value())
+        self.invoke_update()
+        return True
+
+
+    def __insert_fitted(self, index, fitted):
+        self.entry.insert(index, fitted)
+        self.entry.icursor(index + len(fitted))
 
 # TYPE
 class DropdownWidget(Base):
@@ -704,15 +2295,22 @@ class DropdownWidget(Base):
             self.dropdown.set(default)
         elif self.options:
             self.dropdown.set(self.options[0])
+        self.reindex()
+        self.track()
 
 
     def get_value(self):
         return self.dropdown.get()
 
 
+    def set_value(self, value=""):
+        if value in self.options:
+            self.dropdown.set(value)
+
+
     def dropdown_callback(self, event):
         # Base
-        self.invoke_update(value=self.get_value())
+        self.invoke_update()
 
 # SCHEMA_VERSION | VERSION | BLENDER_VERSION_MIN | BLENDER_VERSION_MAX
 class VersionWidget(Base):
@@ -780,6 +2378,8 @@ class VersionWidget(Base):
         if allow_ignore:
             self.ignore_var.set(True)
             self.disable()
+        self.reindex()
+        self.track()
 
 
     def get_value(self):
@@ -789,9 +2389,19 @@ class VersionWidget(Base):
         return self.var_major.get(), self.var_minor.get(), self.var_patch.get()
 
 
+    def set_value(self, value=None):
+        if isinstance(self.ignore_checkbox, tk.Checkbutton):
+            self.ignore_var.set(value is None)
+            self.ignore_checkbox_callback()
+        if value is not None:
+            self.var_major.set(value[0])
+            self.var_minor.set(value[1])
+            self.var_patch.set(value[2])
+
+
     def spinbox_callback(self):
         # Base
-        self.invoke_update(value=self.get_value())
+        self.invoke_update()
 
 
     def ignore_checkbox_callback(self):
@@ -818,12 +2428,19 @@ class VersionWidget(Base):
 
 # TAGS | LICENSE | COPYRIGHT | PERMISSIONS | PLATFORMS | EXCLUDE_PATTERNS
 class ListPickWidget(Base):
-    def __init__(self, parent, key='', required=False, row=0, column=0, label_text="Item Picker", items=[]):
+    def __init__(self, parent, key='', required=False, row=0, column=0, label_text="Item Picker", items=[], aliases={}, values={}):
         super().__init__(parent, key=key, required=required)
 
         # Props
-        self.items = items
-        self.selected_indices = set()
+        self.search_index = SearchIndex(items=items, aliases=aliases)
+        self.aliases = aliases
+        self.values = dict(values) # Item : stored value, items without one store their name
+        self.items_of = {}         # Stored value : item
+        self.item_indices = {}     # Item : item indices, duplicates share a name
+        self.extras = []           # Set values the list does not offer, shown as extra items
+        self.last_query = ""
+        self.loading = not items
+        self.held = []             # Values set while loading, selected once the items arrive
 
         # Frame
         self.frame = tk.Frame(self.parent)
@@ -843,25 +2460,19 @@ class ListPickWidget(Base):
         self.search_entry   = tk.Entry(self.frame)
         self.clr_search_btn = tk.Button(self.frame, text="Clear Search", command=self.__clear_search_command)
         self.clr_sel_btn    = tk.Button(self.frame, text="Deselect All", command=self.__clear_selection_command)
-        self.listbox        = tk.Listbox(self.frame, selectmode=tk.MULTIPLE, exportselection=0, selectbackground=COLORS.BG4, selectforeground=COLORS.WHITE, height=6)
-        self.scrollbar      = tk.Scrollbar(self.frame, orient=tk.VERTICAL)
+        self.list           = VirtualList(self.frame, multiple=True, height=6, on_select=self.__list_select_callback)
 
         # Position
-        self.label.grid         (row=0, column=0, sticky="w", padx=PADX)
-        self.search_label.grid  (row=0, column=1, sticky="e", padx=PADX)
-        self.search_entry.grid  (row=0, column=2, sticky="we", padx=PADX)
-        self.clr_search_btn.grid(row=0, column=3, sticky="w")
-        self.clr_sel_btn.grid   (row=0, column=4, sticky="e")
-        self.listbox.grid       (row=1, column=1, columnspan=4, sticky="snew")
-        self.scrollbar.grid     (row=1, column=4, sticky="ens")
+        self.label.grid             (row=0, column=0, sticky="w", padx=PADX)
+        self.search_label.grid      (row=0, column=1, sticky="e", padx=PADX)
+        self.search_entry.grid      (row=0, column=2, sticky="we", padx=PADX)
+        self.clr_search_btn.grid    (row=0, column=3, sticky="w")
+        self.clr_sel_btn.grid       (row=0, column=4, sticky="e")
+        self.list.listbox.grid      (row=1, column=1, columnspan=4, sticky="snew")
+        self.list.scrollbar.grid    (row=1, column=4, sticky="ens")
 
         # Binds
         self.search_entry.bind("<KeyRelease>", self.__search_key_callback)
-        self.listbox.bind("<<ListboxSelect>>", self.__listbox_select_callback)
-
-        # Link scrollbar
-        self.listbox.config(yscrollcommand=self.scrollbar.set)
-        self.scrollbar.config(command=self.listbox.yview)
 
         # Config
         config_widget(self.frame)
@@ -872,81 +2483,159 @@ class ListPickWidget(Base):
         config_widget(self.clr_sel_btn)
 
         # Init
-        self.__rebuild_list()
+        self.__set_items(items)
+        self.track()
 
 
     def get_value(self):
-        return [item for i, item in enumerate(self.items) if i in self.selected_indices]
+        if self.loading:
+            return list(self.held)
+        return [self.values.get(self.list.items[i], self.list.items[i]) for i in self.list.get_selected()]
 
 
-    def external_update_list(self, items=[]):
-        self.items = items
-        self.selected_indices = set()
-        self.__rebuild_list()
+    def set_value(self, values=[]):
+        values = list(values or [])
+        if self.loading:
+            self.held = values
+            return
+        self.__add_missing(values)
+        indices = self.__indices_of(values)
+        self.list.set_selected(self.list.selected - indices, state=False)
+        self.list.set_selected(indices)
+
+
+    def external_update_list(self, items=[], keep_selection=False, aliases={}, values={}):
+        selected = self.get_value() if keep_selection or self.loading else []
+        # Kept : set values outside the list, picks the new list no longer offers are dropped
+        kept = set(self.extras) | (set(selected) if self.loading else set())
+        self.search_index = SearchIndex(items=items, aliases=aliases)
+        self.aliases = aliases
+        self.values = dict(values)
+        self.extras = []
+        self.last_query = ""
+        self.loading = False
+        self.held = []
+        self.list.listbox.config(state=tk.NORMAL)
+        self.search_entry.config(state=tk.NORMAL)
+        self.search_entry.delete(0, tk.END)
+        self.__set_items(items)
+        self.__add_missing([value for value in selected if value in kept])
+        self.list.set_selected(self.__indices_of(selected))
 
 
-    def __rebuild_list(self):
-        # Rebuild
-        self.listbox.delete(0, tk.END)
-        for i, item in enumerate(self.items):
-            self.listbox.insert(tk.END, item)
-            if i in self.selected_indices:
-                self.listbox.selection_set(i)
-        color_rows(self.listbox)
+    def external_select(self, values=[]):
+        if not self.list.set_selected(self.__indices_of(values)):
+            return
+        # Base
+        self.invoke_update()
+
+
+    def set_loading(self, text="Loading..."):
+        if not self.loading:
+            self.held = self.get_value()
+            self.loading = True
+        self.search_index = SearchIndex()
+        self.item_indices = {}
+        self.last_query = ""
+        self.list.listbox.config(state=tk.NORMAL)
+        self.list.set_placeholder(text)
+        self.list.listbox.config(state=tk.DISABLED)
+        self.search_entry.config(state=tk.DISABLED)
+        self.reindex()
+
+
+    def __set_items(self, items=[]):
+        self.item_indices = {}
+        self.items_of = {value: item for item, value in self.values.items()}
+        for i, item in enumerate(items):
+            self.item_indices.setdefault(item, []).append(i)
+        self.list.set_items(items)
+        self.reindex()
+
+
+    def palette_entries(self):
+        label = self.label.cget("text")
+        entries = [((label,), label, None)]
+        for i, item in enumerate(self.list.items):
+            alias = self.aliases.get(item) if self.aliases else None
+            texts = (item, alias, label) if alias else (item, label)
+            entries.append((texts, f"{label} : {item}", i))
+        return entries
+
+
+    def palette_jump(self, index=None):
+        super().palette_jump(index)
+        if index is None:
+            return
+        if self.search_entry.get():
+            self.__clear_search_command()
+        self.list.reveal(index)
+        self.list.toggle(index)
+        # Base
+        self.invoke_update()
+
+
+    def __indices_of(self, values=[]):
+        return {i for value in values for i in self.item_indices.get(self.items_of.get(value, value), ())}
+
+
+    # Custom patterns, LicenseRef-* licenses, unknown tags : added to the list instead of dropped
+    def __add_missing(self, values=[]):
+        missing = []
+        for value in values:
+            # (Name, Reason) pairs : the name is shown, the pair is stored
+            if isinstance(value, tuple):
+                item = value[0]
+                self.values[item] = value
+                self.items_of[value] = item
+            else:
+                item = self.items_of.get(value, value)
+                if isinstance(self.values.get(item), tuple):
+                    del self.values[item]
+            if item not in self.item_indices and item not in missing:
+                missing.append(item)
+                self.extras.append(value)
+        if not missing:
+            return
+        items = self.list.items + missing
+        self.search_index = SearchIndex(items=items, aliases=self.aliases)
+        self.__set_items(items)
 
 
     def __clear_search_command(self):
         self.search_entry.delete(0, tk.END)
-        self.__rebuild_list()
+        self.__search_key_callback()
 
 
     def __clear_selection_command(self):
-        self.selected_indices.clear()
-        self.listbox.selection_clear(0, tk.END)
-        color_rows(self.listbox)
+        self.list.clear_selection()
         # Base
-        self.invoke_update(value=self.get_value())
+        self.invoke_update()
 
 
     def __search_key_callback(self, event=None):
         # Search Chars
-        search_term = self.search_entry.get().lower()
-        self.listbox.delete(0, tk.END)
+        search_term = self.search_entry.get()
+        if search_term == self.last_query:
+            return
 
         # Search Box Cleared
-        if not search_term:
-            self.__rebuild_list()
-        # Refine Items
+        if not search_term.strip():
+            view = list(range(len(self.list.items)))
+        # Query Grew : narrow the current rows
+        elif self.last_query.strip() and search_term.startswith(self.last_query):
+            view = self.search_index.search(search_term, within=self.list.view)
+        # Refine Items : ranked
         else:
-            current_index = 0
-            for i, item in enumerate(self.items):
-                splits = search_term.split()
-                if all(split.lower() in item.lower() for split in splits):
-                    self.listbox.insert(tk.END, item)
-                    if i in self.selected_indices:
-                        self.listbox.selection_set(current_index)
-                    current_index += 1
-
-        selected_items = [item for i, item in enumerate(self.items) if i in self.selected_indices]
-        color_rows(self.listbox, selected_items)
-
-
-    def __listbox_select_callback(self, event=None):
-        # Current
-        selected_items = {self.listbox.get(i) for i in self.listbox.curselection()}
-        listed_items = set(self.listbox.get(0, tk.END))
-
-        # Selected Indices
-        for i, item in enumerate(self.items):
-            if item in selected_items:
-                self.selected_indices.add(i)
-            elif i in self.selected_indices:
-                self.selected_indices.remove(i)
-        
-        selected_items = [item for i, item in enumerate(self.items) if i in self.selected_indices]
-        color_rows(self.listbox, selected_items)
+            view = self.search_index.search(search_term)
+
+        self.list.set_view(view)
+        self.last_query = search_term
+
+
+    def __list_select_callback(self, index=None):
         # Base
-        self.invoke_update(value=self.get_value())
+        self.invoke_update()
 
 # WHEELS | INCLUDE_PATHS
 class EntryListWidget(Base):
@@ -955,6 +2644,7 @@ class EntryListWidget(Base):
 
         # Props
         self.entry_var = tk.StringVar()
+        self.rule = get_field_rule(key)
 
         # Create Frame
         self.frame = tk.Frame(self.parent)
@@ -970,23 +2660,15 @@ class EntryListWidget(Base):
         self.entry     = tk.Entry(self.frame, textvariable=self.entry_var)
         self.add_btn   = tk.Button(self.frame, text="Add", command=self.add_entry)
         self.del_btn   = tk.Button(self.frame, text="Delete", command=self.delete_entry)
-        self.listbox   = tk.Listbox(self.frame, height=6)
-        self.scrollbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL)
+        self.list      = VirtualList(self.frame, multiple=False, height=6, on_activate=self.edit_entry)
 
         # Position
         self.label.grid(row=0, column=0, sticky="w")
         self.entry.grid(row=0, column=1, sticky="we")
         self.add_btn.grid(row=0, column=2, sticky="w")
         self.del_btn.grid(row=0, column=3, sticky="w")
-        self.listbox.grid(row=1, column=1, columnspan=3, sticky="nsew")
-        self.scrollbar.grid(row=1, column=3, sticky="ens")
-
-        # Link scrollbar
-        self.listbox.config(yscrollcommand=self.scrollbar.set)
-        self.scrollbar.config(command=self.listbox.yview)
-
-        # Binds
-        self.listbox.bind("<Double-Button-1>", self.edit_entry)
+        self.list.listbox.grid(row=1, column=1, columnspan=3, sticky="nsew")
+        self.list.scrollbar.grid(row=1, column=3, sticky="ens")
 
         # Config
         config_widget(self.frame)
@@ -994,54 +2676,94 @@ class EntryListWidget(Base):
         config_widget(self.entry)
         config_widget(self.add_btn)
         config_widget(self.del_btn)
-        config_widget(self.listbox)
+
+        # Init
+        self.reindex()
+        self.track()
 
 
     def get_value(self):
-        result = self.listbox.get(0, tk.END)
-        if not result:
-            return []
-        return result
+        return list(self.list.items)
+
+
+    def set_value(self, items=[]):
+        self.list.set_items(items or [])
+        self.reindex()
+
+
+    def palette_entries(self):
+        label = self.label.cget("text")
+        return [((label,), label, None)] + [((item, label), f"{label} : {item}", i) for i, item in enumerate(self.list.items)]
+
+
+    def palette_jump(self, index=None):
+        super().palette_jump(index)
+        if index is None or index >= len(self.list.items):
+            return
+        self.list.reveal(index)
+        self.list.set_selected(self.list.selected - {index}, state=False)
+        self.list.set_selected({index})
 
 
     def add_entry(self):
         entry_text = self.entry_var.get().strip()
-        if entry_text and entry_text not in self.listbox.get(0, tk.END):
-            self.listbox.insert(tk.END, entry_text)
+        if entry_text and entry_text not in self.list.items and self.__is_valid(entry_text):
+            self.list.items.append(entry_text)
+            self.list.view.append(len(self.list.items) - 1)
+            self.list.top = len(self.list.view)
+            self.list.render()
             self.entry_var.set("")
-            color_rows(self.listbox)
+            self.reindex()
+            # Base
+            self.invoke_update()
         else:
             messagebox.showwarning("Warning", "Invalid or duplicate entry.")
 
 
     def delete_entry(self):
-        selected_indices = self.listbox.curselection()
-        for index in reversed(selected_indices):
-            self.listbox.delete(index)
+        if not self.list.selected: return
+        items = [item for i, item in enumerate(self.list.items) if i not in self.list.selected]
+        self.list.set_items(items)
+        self.reindex()
+        # Base
+        self.invoke_update()
 
 
-    def edit_entry(self, event):
-        selected_index = self.listbox.curselection()
-        if not selected_index: return
+    def edit_entry(self, index=None):
+        if index is None: return
 
-        index = selected_index[0]
-        current_text = self.listbox.get(index)
+        current_text = self.list.items[index]
         current_text = current_text if current_text else ""
         
         result = EntryPopup.invoke(parent=self.frame, width=350, height=100, label_text="Entry", prompt_text="Edit", entry_text=current_text)
         if not result: return
+        if not self.__is_valid(result.strip()):
+            messagebox.showwarning("Warning", "Invalid entry.")
+            return
 
-        self.listbox.delete(index)
-        self.listbox.insert(index, result)
+        self.list.items[index] = result
+        self.list.redraw()
+        self.reindex()
 
         # Base
-        self.invoke_update(value=self.get_value())
+        self.invoke_update()
+
+
+    def __is_valid(self, text=""):
+        if not self.rule or not self.rule.pattern:
+            return True
+        return bool(self.rule.pattern.fullmatch(text))
 
 # MANIFEST | VALIDATE | BUILD
 class TextBoxWidget(Base):
-    def __init__(self, parent, key='', required=False, row=0, column=0, label_text="Text Box"):
+    def __init__(self, parent, key='', required=False, row=0, column=0, label_text="Text Box", syntax=None):
         super().__init__(parent, key=key, required=required)
 
+        # Props
+        self.lines = []        # Mirror of the read-only buffer, each line ends with a newline in Tk
+        self.gutter_lines = 0  # Line numbers shown
+        self.highlighter = None
+
         # Frame
         self.frame = tk.Frame(self.parent)
         self.frame.grid(row=row, column=column, sticky=WSTICKY)
@@ -1084,20 +2806,54 @@ class TextBoxWidget(Base):
         config_widget(self.frame)
         config_widget(self.text_frame)
         config_widget(self.label, self.required)
+        if syntax == 'TOML':
+            self.highlighter = TomlHighlighter(self.text_box)
 
 
     def get_value(self):
-        text = self.text_box.get(1.0, tk.END).strip()
-        return text.split("\n")
+        return list(self.lines)
 
 
     def set_value(self, lines=[]):
+        self.lines = "\n".join(lines).split("\n") if lines else []
+        # Bulk : one insert for the whole buffer
         self.text_box.config(state=tk.NORMAL)
         self.text_box.delete(1.0, tk.END)
-        for line in lines:
-            self.text_box.insert(tk.END, line + "\n")
+        self.text_box.insert(tk.END, "".join(line + "\n" for line in self.lines))
+        self.text_box.config(state=tk.DISABLED)
+        if self.highlighter:
+            self.highlighter.reset()
+            self.highlighter.update(self.lines, 0, 0, len(self.lines))
+        self.__update_line_numbers()
+        # Base
+        self.invoke_update()
+
+
+    # Replaces only the run of lines between the unchanged head and tail
+    def update_lines(self, lines=[]):
+        old = self.lines
+        new = "\n".join(lines).split("\n") if lines else []
+        start = 0
+        limit = min(len(old), len(new))
+        while start < limit and old[start] == new[start]:
+            start += 1
+        old_end = len(old)
+        new_end = len(new)
+        while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+        if start == old_end and start == new_end:
+            return
+        self.lines = new
+        self.text_box.config(state=tk.NORMAL)
+        self.text_box.delete(f"{start + 1}.0", f"{old_end + 1}.0")
+        self.text_box.insert(f"{start + 1}.0", "".join(line + "\n" for line in new[start:new_end]))
         self.text_box.config(state=tk.DISABLED)
+        if self.highlighter:
+            self.highlighter.update(self.lines, start, old_end, new_end)
         self.__update_line_numbers()
+        # Base
+        self.invoke_update()
 
 
     def __sync_scroll_command(self, *args):
@@ -1116,33 +2872,378 @@ class TextBoxWidget(Base):
 
 
     def __update_line_numbers(self):
-        num_lines = int(self.text_box.index('end-1c').split('.')[0])
-        line_numbers = '\n'.join(str(i) for i in range(1, num_lines + 1))
+        num_lines = max(1, len(self.lines))
+        if num_lines == self.gutter_lines:
+            return
         self.line_numbers.config(state=tk.NORMAL)
-        self.line_numbers.delete(1.0, tk.END)
-        self.line_numbers.insert(tk.END, line_numbers)
-        self.line_numbers.config(state=tk.DISABLED)
-        # Base
-        self.invoke_update(value=self.get_value())
+        # Grew : append only the new numbers
+        if num_lines > self.gutter_lines:
+            line_numbers = '\n'.join(str(i) for i in range(self.gutter_lines + 1, num_lines + 1))
+            self.line_numbers.insert(tk.END, "\n" + line_numbers if self.gutter_lines else line_numbers)
+        # Shrank : drop the numbers past the last line
+        else:
+            self.line_numbers.delete(f"{num_lines}.end", tk.END)
+        self.line_numbers.config(state=tk.DISABLED, width=max(3, len(str(num_lines))))
+        self.gutter_lines = num_lines
+        self.line_numbers.yview_moveto(self.text_box.yview()[0])
 
 
     def __on_text_changed_callback(self, event):
         self.__update_line_numbers()
         self.text_box.edit_modified(False)
 
+# VALIDATE | BUILD OUTPUT
+class LogWidget(Base):
+    FILTERS = ["All", "ERROR", "WARNING"]
+
+    def __init__(self, parent, key='', required=False, row=0, column=0, label_text="Output", max_lines=LOG_MAX_LINES, max_bytes=LOG_MAX_BYTES):
+        super().__init__(parent, key=key, required=required)
+
+        # Props
+        self.buffer = LogBuffer(max_lines=max_lines, max_bytes=max_bytes)
+        self.shown = deque() # Sequences in the text widget, oldest first
+
+        # Frame
+        self.frame = tk.Frame(self.parent)
+        self.frame.grid(row=row, column=column, sticky=WSTICKY)
+
+        # Layout
+        self.frame.columnconfigure(0, minsize=LABEL_WIDTH)
+        self.frame.columnconfigure(3, weight=1)
+        self.frame.rowconfigure(1, weight=1)
+
+        # Widgets
+        self.label        = tk.Label(self.frame, text=label_text)
+        self.filter_box   = ttk.Combobox(self.frame, values=self.FILTERS, state="readonly", width=10)
+        self.search_label = tk.Label(self.frame, text="Search")
+        self.search_entry = tk.Entry(self.frame)
+        self.count_label  = tk.Label(self.frame, text="")
+        self.text_box     = tk.Text(self.frame, wrap=tk.NONE, state=tk.DISABLED, height=10, bg=COLORS.BLACK, fg=COLORS.WHITE)
+        self.scrollbar    = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.text_box.yview)
+
+        # Position
+        self.label.grid       (row=0, column=0, sticky="w", padx=PADX)
+        self.filter_box.grid  (row=0, column=1, sticky="w", padx=PADX)
+        self.search_label.grid(row=0, column=2, sticky="e", padx=PADX)
+        self.search_entry.grid(row=0, column=3, sticky="we", padx=PADX)
+        self.count_label.grid (row=0, column=4, sticky="e", padx=PADX)
+        self.text_box.grid    (row=1, column=1, columnspan=4, sticky="nsew")
+        self.scrollbar.grid   (row=1, column=5, sticky="ns")
+
+        # Link Scrollbar
+        self.text_box.config(yscrollcommand=self.scrollbar.set)
+
+        # Binds
+        self.filter_box.bind("<<ComboboxSelected>>", lambda event: self.refresh())
+        self.search_entry.bind("<KeyRelease>", lambda event: self.refresh())
+
+        # Config
+        config_widget(self.frame)
+        config_widget(self.label, self.required)
+        config_widget(self.search_label)
+        config_widget(self.search_entry)
+        config_widget(self.count_label)
+        self.text_box.tag_configure("ERROR", foreground=COLORS.ERROR)
+        self.text_box.tag_configure("WARNING", foreground=COLORS.REQ)
+
+        # Init
+        self.filter_box.set(self.FILTERS[0])
+        self.__update_counts()
+
+
+    def get_value(self):
+        return [self.buffer.get(sequence)[1] for sequence in range(self.buffer.first, self.buffer.next)]
+
+
+    def append(self, lines=[]):
+        added = self.buffer.append(lines)
+        # New : only lines passing the filter reach the view
+        severity, text = self.__filters()
+        if severity or text:
+            added = [sequence for sequence in added if self.__matches(sequence, severity, text)]
+        self.__insert(added)
+        # Evicted : drop the same lines from the top of the view
+        evicted = 0
+        while self.shown and self.shown[0] < self.buffer.first:
+            self.shown.popleft()
+            evicted += 1
+        if evicted:
+            self.text_box.config(state=tk.NORMAL)
+            self.text_box.delete(1.0, f"{evicted + 1}.0")
+            self.text_box.config(state=tk.DISABLED)
+        self.__update_counts()
+
+
+    def clear(self):
+        self.buffer.clear()
+        self.shown.clear()
+        self.text_box.config(state=tk.NORMAL)
+        self.text_box.delete(1.0, tk.END)
+        self.text_box.config(state=tk.DISABLED)
+        self.__update_counts()
+
+
+    def refresh(self):
+        severity, text = self.__filters()
+        self.shown.clear()
+        self.text_box.config(state=tk.NORMAL)
+        self.text_box.delete(1.0, tk.END)
+        self.text_box.config(state=tk.DISABLED)
+        self.__insert(self.buffer.find(severity=severity, text=text))
+
+
+    def __filters(self):
+        severity = self.filter_box.get()
+        return (severity if severity in LogBuffer.SEVERITIES else None), self.search_entry.get()
+
+
+    def __matches(self, sequence, severity=None, text=""):
+        line_severity, line, _ = self.buffer.get(sequence)
+        if severity and line_severity != severity:
+            return False
+        return not text or text.casefold() in line.casefold()
+
+
+    def __insert(self, sequences=[]):
+        if not sequences:
+            return
+        # Bulk : one insert call, severity tags inline
+        chunks = []
+        for sequence in sequences:
+            severity, line, _ = self.buffer.get(sequence)
+            chunks.extend(("\n" + line if self.shown or chunks else line, severity))
+        self.shown.extend(sequences)
+        follow = self.text_box.yview()[1] >= 1.0
+        self.text_box.config(state=tk.NORMAL)
+        self.text_box.insert(tk.END, *chunks)
+        self.text_box.config(state=tk.DISABLED)
+        if follow:
+            self.text_box.see(tk.END)
+
+
+    def __update_counts(self):
+        counts = self.buffer.counts()
+        self.count_label.config(text=f"{counts['ERROR']} errors | {counts['WARNING']} warnings | {len(self.buffer)} lines")
+
+# CTRL+P : jump to any field, list item or entry
+class CommandPalette:
+    def __init__(self, root, index=PALETTE_INDEX):
+        # Props
+        self.root = root
+        self.index = index
+        self.results = []
+        self.last_query = None
+        self.window = None
+        self.entry = None
+        self.list = None
+
+
+    def open(self, event=None):
+        if self.window:
+            self.entry.focus_set()
+            return "break"
+
+        # Window
+        self.window = tk.Toplevel(self.root)
+        self.window.title("Go To")
+        self.window.transient(self.root)
+        self.window.columnconfigure(0, weight=1)
+        self.window.rowconfigure(1, weight=1)
+        self.window.configure(background=COLORS.BLACK, padx=PADX, pady=PADY)
+
+        # Widgets
+        self.entry = tk.Entry(self.window, width=PALETTE_WIDTH)
+        self.list  = VirtualList(self.window, multiple=False, height=PALETTE_ROWS, on_activate=self.activate)
+
+        # Position
+        self.entry.grid(row=0, column=0, columnspan=2, sticky="we", pady=PADY)
+        self.list.listbox.grid(row=1, column=0, sticky="nsew")
+        self.list.scrollbar.grid(row=1, column=1, sticky="ns")
+
+        # Binds
+        self.entry.bind("<KeyRelease>", self.__search_key_callback)
+        self.entry.bind("<Down>", lambda event: self.__move(1))
+        self.entry.bind("<Up>", lambda event: self.__move(-1))
+        self.entry.bind("<Return>", lambda event: self.activate(self.__current()))
+        self.window.bind("<Escape>", self.close)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        # Config
+        config_widget(self.entry)
+
+        # Init
+        self.search("")
+        self.entry.focus_set()
+        return "break"
+
+
+    def close(self, event=None):
+        if self.window:
+            self.window.destroy()
+        self.window = None
+        self.entry = None
+        self.list = None
+        self.last_query = None
+
+
+    def search(self, query=""):
+        self.last_query = query
+        self.results = self.index.search(query)
+        self.list.set_items([label for _, label, _ in self.results])
+        if self.results:
+            self.list.set_selected({0})
+
+
+    def activate(self, index=None):
+        if index is None or index >= len(self.results):
+            return "break"
+        source, _, payload = self.results[index]
+        self.close()
+        source.palette_jump(payload)
+        return "break"
+
+
+    def __current(self):
+        selected = self.list.get_selected()
+        return selected[0] if selected else None
+
+
+    def __move(self, step=1):
+        if not self.results:
+            return "break"
+        current = self.__current()
+        index = 0 if current is None else max(0, min(current + step, len(self.results) - 1))
+        self.list.clear_selection()
+        self.list.set_selected({index})
+        self.list.reveal(index)
+        return "break"
+
+
+    def __search_key_callback(self, event=None):
+        query = self.entry.get()
+        if query != self.last_query:
+            self.search(query)
+
 ########################•########################
 """                 COMMANDERS                """
 ########################•########################
 
-@try_except_decorator
-def set_licenses():
-    global LICENSES
-    url = 'https://spdx.org/licenses/'
-    response = requests.get(url)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, 'html.parser')
+# File format shared by the bundled snapshot and the user cache
+# Key : Full License Name
+# Val : SPDX Identifier
+class LicenseCache:
+    def __init__(self, file_path=LICENSES_CACHE_FILE):
+        self.file_path = Path(file_path)
+        self.licenses = {}
+        self.version = ""
+        self.release_date = ""
+        self.etag = None
+        self.last_modified = None
+        self.fetched_at = 0.0
+
+
+    def load(self):
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get("format") != LICENSES_FORMAT:
+            return False
+        licenses = data.get("licenses")
+        if not isinstance(licenses, dict) or not licenses:
+            return False
+        self.licenses = licenses
+        self.version = data.get("version", "")
+        self.release_date = data.get("release_date", "")
+        self.etag = data.get("etag")
+        self.last_modified = data.get("last_modified")
+        self.fetched_at = float(data.get("fetched_at", 0.0))
+        return True
+
+
+    def save(self):
+        data = {
+            "format": LICENSES_FORMAT,
+            "version": self.version,
+            "release_date": self.release_date,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "fetched_at": self.fetched_at,
+            "licenses": self.licenses,
+        }
+        # Atomic : a crash mid-write keeps the last good snapshot
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.file_path.with_name(f"{self.file_path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, self.file_path)
+
+
+    def assign(self, other):
+        self.licenses = other.licenses
+        self.version = other.version
+        self.release_date = other.release_date
+        self.etag = other.etag
+        self.last_modified = other.last_modified
+        self.fetched_at = other.fetched_at
+
+
+    def is_stale(self, ttl=LICENSES_CACHE_TTL):
+        return time.time() - self.fetched_at > ttl
+
+
+    def is_older_than(self, other):
+        return version_key(self.version) < version_key(other.version)
+
+
+    def get_spdx_licenses(self):
+        return {name: f"SPDX:{identifier}" for name, identifier in self.licenses.items()}
+
+
+def version_key(version=""):
+    return tuple(int(part) for part in re.findall(r"\d+", version or ""))
+
+
+HTTP_SESSION = None
+HTTP_SESSION_LOCK = threading.Lock()
+
+def get_http_session():
+    global HTTP_SESSION
+    with HTTP_SESSION_LOCK:
+        if HTTP_SESSION is None:
+            import requests
+            adapter = requests.adapters.HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRIES)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["User-Agent"] = APP_NAME
+            HTTP_SESSION = session
+    return HTTP_SESSION
+
+
+# SPDX licenses.json -> Version, Release Date, Licenses
+def parse_licenses(data={}):
+    entries = data.get("licenses", []) if isinstance(data, dict) else []
+    entries = [entry for entry in entries if isinstance(entry, dict) and not entry.get("isDeprecatedLicenseId", False)]
+    entries.sort(key=lambda entry: str(entry.get("licenseId", "")).casefold())
+    licenses = {}
+    for entry in entries:
+        full_name = str(entry.get("name", "")).strip().replace('\"', '')
+        identifier = str(entry.get("licenseId", "")).strip()
+        if full_name and identifier:
+            licenses[full_name] = identifier
+    return data.get("licenseListVersion", ""), data.get("releaseDate", ""), licenses
+
+
+# SPDX HTML table -> Licenses (legacy scraper, kept for benchmarks)
+def parse_licenses_html(html=""):
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
     table = soup.find('table')
     licenses = {}
+    if table is None:
+        return licenses
     for row in table.find_all('tr')[1:]:
         columns = row.find_all('td')
         if len(columns) >= 2:
@@ -1150,18 +3251,693 @@ def set_licenses():
             identifier = columns[1].get_text(strip=True).replace('\"', '')
             if full_name and identifier:
                 licenses[full_name] = identifier
-    
-    for key, value in licenses.items():
-        LICENSES[key] = f"SPDX:{value}"
+    return licenses
+
+
+def fetch_licenses(cache, url=LICENSES_URL, timeout=HTTP_TIMEOUT):
+    # Conditional : only when there is a snapshot to fall back on
+    headers = {}
+    if cache.licenses:
+        if cache.etag:
+            headers["If-None-Match"] = cache.etag
+        if cache.last_modified:
+            headers["If-Modified-Since"] = cache.last_modified
+    response = get_http_session().get(url, headers=headers, timeout=timeout)
+    # Unchanged
+    if response.status_code == 304 and cache.licenses:
+        cache.fetched_at = time.time()
+        cache.save()
+        return False
+    response.raise_for_status()
+    version, release_date, licenses = parse_licenses(response.json())
+    if not licenses:
+        raise ValueError(f"No licenses found at {url}")
+    changed = licenses != cache.licenses
+    # Store
+    cache.licenses = licenses
+    cache.version = version
+    cache.release_date = release_date
+    cache.etag = response.headers.get("ETag")
+    cache.last_modified = response.headers.get("Last-Modified")
+    cache.fetched_at = time.time()
+    cache.save()
+    return changed
+
+
+@try_except_decorator
+def revalidate_licenses(cache, url=LICENSES_URL, timeout=HTTP_TIMEOUT, on_update=None):
+    import requests
+    try:
+        changed = fetch_licenses(cache, url=url, timeout=timeout)
+    except requests.RequestException as e:
+        print(f"Licenses offline, using cached snapshot : {e.__class__.__name__}")
+        return
+    if changed:
+        if callable(on_update):
+            on_update(cache.get_spdx_licenses())
+
+
+@try_except_decorator
+def set_licenses(url=LICENSES_URL, cache_path=LICENSES_CACHE_FILE, snapshot_path=LICENSES_SNAPSHOT_FILE, ttl=LICENSES_CACHE_TTL, timeout=HTTP_TIMEOUT, on_update=None):
+    cache = LicenseCache(file_path=cache_path)
+    cache.load()
+    # Bundled : when there is no cache yet or the tool ships a newer list
+    snapshot = LicenseCache(file_path=snapshot_path)
+    if snapshot.load() and (not cache.licenses or cache.is_older_than(snapshot)):
+        cache.assign(snapshot)
+    # Snapshot : use now, refresh once expired (callers run this on a worker)
+    if cache.licenses:
+        if callable(on_update):
+            on_update(cache.get_spdx_licenses())
+        if cache.is_stale(ttl=ttl):
+            revalidate_licenses(cache, url=url, timeout=timeout, on_update=on_update)
+        return
+    # First Run
+    print(f"Fetching licenses : {url}")
+    fetch_licenses(cache, url=url, timeout=timeout)
+    if callable(on_update):
+        on_update(cache.get_spdx_licenses())
+
+# Whole group on POSIX : launcher scripts leave children holding the output pipe
+def kill_process(process):
+    if process.poll() is not None:
+        return
+    if os.name == "posix":
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+        except OSError:
+            pass
+    process.kill()
+
+
+# Streams stdout + stderr line by line, then a status line
+def run_command(command=[]):
+    try:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace", bufsize=1, start_new_session=os.name == "posix")
+    except OSError as e:
+        yield f"Error : {e}"
+        return
+    # Job : cancel() kills the process instead of waiting for its next line
+    job = current_job()
+    if job:
+        job.process = process
+        if job.cancelled:
+            kill_process(process)
+    with process:
+        try:
+            for line in process.stdout:
+                yield line.rstrip("\r\n")
+        except GeneratorExit:
+            # Closed early : cancelled, do not wait for the process to finish
+            kill_process(process)
+            raise
+    if process.returncode:
+        yield f"Error : Return code {process.returncode}"
+    else:
+        yield "Command succeeded"
+
+########################•########################
+"""                 DETECTORS                 """
+########################•########################
+
+# Token fingerprints of the SPDX corpus, matched by shared shingles instead of text diffs
+class LicenseFingerprints:
+    WORDS = re.compile(r"[a-z0-9]+")
+    COPYRIGHT_LINES = re.compile(r"^\s*(copyright|\(c\)|©).*$", re.MULTILINE)
+    RESULTS_LIMIT = 4096
+
+    def __init__(self, file_path=FINGERPRINTS_FILE):
+        self.file_path = Path(file_path)
+        self.ids = []       # Per License : SPDX Identifier
+        self.hashes = []    # Per License : shingle hashes
+        self.sampled = []   # Per License : hashes are 1 in FINGERPRINT_SAMPLE_MOD
+        self.postings = {}  # Shingle Hash : license indices
+        self.results = {}   # Text Digest : matches
+        self.files = {}     # (File Size, Head Digest) : matches
+
+
+    def load(self):
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get("format") != FINGERPRINTS_FORMAT:
+            return False
+        if data.get("shingle") != FINGERPRINT_SHINGLE:
+            return False
+        sampled = set(data.get("sampled", []))
+        for identifier, packed in data.get("licenses", {}).items():
+            hashes = array("I")
+            hashes.frombytes(base64.b64decode(packed))
+            self.add(identifier, hashes, sampled=identifier in sampled)
+        return bool(self.ids)
+
+
+    def save(self):
+        data = {
+            "format": FINGERPRINTS_FORMAT,
+            "shingle": FINGERPRINT_SHINGLE,
+            "sampled": [identifier for identifier, sampled in zip(self.ids, self.sampled) if sampled],
+            "licenses": {identifier: base64.b64encode(array("I", sorted(hashes)).tobytes()).decode("ascii") for identifier, hashes in zip(self.ids, self.hashes)},
+        }
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.file_path.with_name(f"{self.file_path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, separators=(",", ":"))
+        os.replace(temp_path, self.file_path)
+
+
+    def add(self, identifier, hashes, sampled=False):
+        index = len(self.ids)
+        hashes = frozenset(hashes)
+        self.ids.append(identifier)
+        self.hashes.append(hashes)
+        self.sampled.append(sampled)
+        for value in hashes:
+            postings = self.postings.get(value)
+            if postings is None:
+                self.postings[value] = [index]
+            else:
+                postings.append(index)
+
+
+    @classmethod
+    def tokenize(cls, text=""):
+        # Copyright statements differ between otherwise identical copies
+        return cls.WORDS.findall(cls.COPYRIGHT_LINES.sub("", text.lower()))
+
+
+    @staticmethod
+    def fingerprint(words=[]):
+        shingles = map(" ".join, zip(*(words[i:] for i in range(FINGERPRINT_SHINGLE))))
+        return set(map(zlib.crc32, map(str.encode, shingles)))
+
+
+    def add_text(self, identifier, text=""):
+        hashes = self.fingerprint(self.tokenize(text))
+        if len(hashes) <= FINGERPRINT_SAMPLE_MIN:
+            self.add(identifier, hashes)
+        else:
+            self.add(identifier, {value for value in hashes if value % FINGERPRINT_SAMPLE_MOD == 0}, sampled=True)
+
+
+    def match(self, text="", min_coverage=FINGERPRINT_MIN_COVERAGE):
+        # Vendored copies are usually identical
+        words = self.tokenize(text)
+        digest = hashlib.sha1(" ".join(words).encode()).digest()
+        if digest in self.results:
+            return self.results[digest]
+        hashes = self.fingerprint(words)
+        counts = Counter(chain.from_iterable(map(self.postings.__getitem__, self.postings.keys() & hashes)))
+        # Candidates : closest in size and content first, identical texts resolve to "-or-later"
+        candidates = []
+        file_sizes = (len(hashes), len([value for value in hashes if value % FINGERPRINT_SAMPLE_MOD == 0]))
+        for index, count in counts.items():
+            size = len(self.hashes[index])
+            coverage = count / size
+            if coverage >= min_coverage and count >= min(2, size):
+                dice = 2 * count / (size + file_sizes[self.sampled[index]])
+                candidates.append((-dice, not self.ids[index].endswith("-or-later"), self.ids[index], coverage, index))
+        candidates.sort()
+        # Greedy : skip variants whose matched text was already claimed
+        matches = []
+        claimed = set()
+        for _, _, identifier, coverage, index in candidates:
+            matched = self.hashes[index] & hashes
+            if len(matched & claimed) * 2 > len(matched):
+                continue
+            claimed |= matched
+            matches.append((identifier, round(coverage, 3)))
+        if len(self.results) >= self.RESULTS_LIMIT:
+            self.results.clear()
+        self.results[digest] = matches
+        return matches
+
+
+    def match_file(self, file_path, min_coverage=FINGERPRINT_MIN_COVERAGE):
+        # Vendored copies : same size and head, skip the full read and tokenize
+        with open(file_path, "rb") as file:
+            head = file.read(FINGERPRINT_HEAD_BYTES)
+            key = (os.fstat(file.fileno()).st_size, hashlib.sha1(head).digest())
+            if key in self.files:
+                return self.files[key]
+            data = head + file.read()
+        matches = self.match(data.decode("utf-8", "replace"), min_coverage=min_coverage)
+        if len(self.files) >= self.RESULTS_LIMIT:
+            self.files.clear()
+        self.files[key] = matches
+        return matches
+
+
+LICENSE_FINGERPRINTS = None
+LICENSE_FINGERPRINTS_LOCK = threading.Lock()
+
+def get_license_fingerprints():
+    global LICENSE_FINGERPRINTS
+    with LICENSE_FINGERPRINTS_LOCK:
+        if LICENSE_FINGERPRINTS is None:
+            fingerprints = LicenseFingerprints()
+            if not fingerprints.load():
+                print(f"No license fingerprints at {fingerprints.file_path}")
+            LICENSE_FINGERPRINTS = fingerprints
+    return LICENSE_FINGERPRINTS
+
+
+def parse_spdx_expression(expression=""):
+    identifiers = []
+    after_with = False
+    for token in re.findall(r"[A-Za-z0-9.+\-]+", expression):
+        if token.upper() in {"AND", "OR"}:
+            after_with = False
+        elif token.upper() == "WITH":
+            after_with = True
+        elif not after_with:
+            identifiers.append(token)
+    return identifiers
+
+
+# Source Dir -> [(SPDX Identifier, File Path, Score)]
+@try_except_decorator
+def detect_licenses(source_dir, fingerprints=None):
+    detections = []
+    if not PATH_CACHE.check(source_dir, 'DIR'):
+        return detections
+    fingerprints = fingerprints or get_license_fingerprints()
+    job = current_job()
+    for root, dirs, files in os.walk(source_dir):
+        # Cancelled : a newer scan replaced this one
+        if job and job.cancelled:
+            return detections
+        dirs[:] = [name for name in dirs if name not in DETECT_SKIP_DIRS]
+        for name in files:
+            file_path = os.path.join(root, name)
+            # License Files : full text
+            if LICENSE_FILE_PATTERN.match(name):
+                try:
+                    matches = fingerprints.match_file(file_path)
+                except OSError:
+                    continue
+                for identifier, score in matches:
+                    detections.append((identifier, file_path, score))
+            # Source Files : SPDX header
+            elif get_file_extension(name) in SPDX_HEADER_SUFFIXES:
+                try:
+                    with open(file_path, "rb") as file:
+                        head = file.read(SPDX_HEADER_BYTES)
+                except OSError:
+                    continue
+                if b"SPDX-License-Identifier" not in head:
+                    continue
+                for expression in SPDX_HEADER_PATTERN.findall(head):
+                    for identifier in parse_spdx_expression(expression.decode("utf-8", "replace")):
+                        detections.append((identifier, file_path, 1.0))
+    return detections
+
+########################•########################
+"""                  TOOLING                  """
+########################•########################
+
+@try_except_decorator
+def build_license_snapshot(source=LICENSES_URL, file_path=LICENSES_SNAPSHOT_FILE, timeout=HTTP_TIMEOUT):
+    # Source : URL or local copy of SPDX licenses.json
+    if is_path(source):
+        with open(source, "r", encoding="utf-8") as file:
+            data = json.load(file)
+    else:
+        response = get_http_session().get(source, timeout=timeout)
+        response.raise_for_status()
+        data = response.json()
+    version, release_date, licenses = parse_licenses(data)
+    if not licenses:
+        raise ValueError(f"No licenses found in {source}")
+    snapshot = LicenseCache(file_path=file_path)
+    snapshot.licenses = licenses
+    snapshot.version = version
+    snapshot.release_date = release_date
+    snapshot.fetched_at = time.time()
+    snapshot.save()
+    print(f"Snapshot : SPDX {version} ({release_date}) | {len(licenses)} licenses -> {file_path}")
+    return True
+
+
+@try_except_decorator
+def build_license_fingerprints(source_dir, file_path=FINGERPRINTS_FILE):
+    # Source : SPDX license-list-data text folder ( <SPDX Identifier>.txt )
+    fingerprints = LicenseFingerprints(file_path=file_path)
+    for text_path in sorted(Path(source_dir).glob("*.txt"), key=lambda path: path.stem.casefold()):
+        if text_path.stem.startswith("deprecated_"):
+            continue
+        fingerprints.add_text(text_path.stem, text_path.read_text(encoding="utf-8", errors="replace"))
+    if not fingerprints.ids:
+        raise ValueError(f"No license texts found in {source_dir}")
+    fingerprints.save()
+    print(f"Fingerprints : {len(fingerprints.ids)} licenses | {len(fingerprints.postings)} shingles -> {file_path}")
+    return True
+
+
+def time_call(func, repeat=10):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@try_except_decorator
+def benchmark_licenses(html_path=None, snapshot_path=LICENSES_SNAPSHOT_FILE, repeat=20):
+    # Snapshot Load
+    def load_snapshot():
+        snapshot = LicenseCache(file_path=snapshot_path)
+        snapshot.load()
+        return snapshot.get_spdx_licenses()
+    licenses = load_snapshot()
+    if not licenses:
+        print(f"No snapshot at {snapshot_path}")
+        return False
+    snapshot_time = time_call(load_snapshot, repeat=repeat)
+    print(f"Snapshot Load  : {snapshot_time * 1000:8.2f} ms | {len(licenses)} licenses | bs4 imported : {'bs4' in sys.modules}")
+
+    # Scrape + Parse : saved SPDX page, or an equivalent table rendered from the snapshot
+    if html_path:
+        with open(html_path, "r", encoding="utf-8") as file:
+            html = file.read()
+    else:
+        rows = "".join(f"<tr><td>{name}</td><td>{value[5:]}</td></tr>" for name, value in licenses.items())
+        html = f"<html><body><table><tr><th>Full name</th><th>Identifier</th></tr>{rows}</table></body></html>"
+    try:
+        import bs4
+    except ImportError:
+        print("Scrape + Parse : skipped, bs4 is not installed")
+        return True
+    scrape_time = time_call(lambda: parse_licenses_html(html), repeat=max(1, repeat // 4))
+    print(f"Scrape + Parse : {scrape_time * 1000:8.2f} ms | {len(parse_licenses_html(html))} licenses (network excluded)")
+    print(f"Speedup        : {scrape_time / max(snapshot_time, 1e-9):8.1f} x")
+    return True
+
+
+@try_except_decorator
+def benchmark_startup(budget_ms=STARTUP_BUDGET_MS, runs=3, eager=False):
+    # Cold launches : process spawn until the window has processed its first events
+    command = [sys.executable, str(Path(__file__).resolve()), "--startup-probe"]
+    if eager:
+        command.append("--eager")
+    times = []
+    for run in range(runs):
+        start = time.perf_counter()
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        line = process.stdout.readline().strip()
+        elapsed = (time.perf_counter() - start) * 1000
+        _, errors = process.communicate()
+        if not line.startswith("READY"):
+            print(f"Startup probe failed :\n{errors}")
+            return False
+        times.append(elapsed)
+        print(f"Run {run + 1} : {elapsed:8.1f} ms | {line[6:]}")
+    times.sort()
+    median = times[len(times) // 2]
+    passed = median <= budget_ms
+    print(f"Time to interactive : {median:.1f} ms (median of {runs}) | budget {budget_ms} ms | {'PASS' if passed else 'FAIL'}")
+    return passed
+
+
+@try_except_decorator
+def benchmark_search(snapshot_path=LICENSES_SNAPSHOT_FILE, queries=("gpl3", "apache2", "mit", "creative commons by sa 4"), repeat=50):
+    snapshot = LicenseCache(file_path=snapshot_path)
+    if not snapshot.load():
+        print(f"No snapshot at {snapshot_path}")
+        return False
+    items = list(snapshot.licenses.keys())
+    index = SearchIndex(items=items, aliases=snapshot.licenses)
+    build_time = time_call(lambda: SearchIndex(items=items, aliases=snapshot.licenses), repeat=max(1, repeat // 10))
+    print(f"Index Build : {build_time * 1000:8.2f} ms | {len(items)} licenses")
+    for query in queries:
+        query_time = time_call(lambda: index.search(query), repeat=repeat)
+        results = index.search(query)
+        top = snapshot.licenses[items[results[0]]] if results else "-"
+        print(f"{query!r:28}: {query_time * 1000:8.3f} ms | {len(results):3} matches | top : {top}")
+    # Palette : every picker in one index, a swapped list only replaces its own source
+    def entries(label, values, aliases={}):
+        return [((value, aliases[value], label) if value in aliases else (value, label), f"{label} : {value}", i) for i, value in enumerate(values)]
+    palette = PaletteIndex()
+    pickers = {"Tags": ADDON_TAGS, "License(s)": items, "Permissions": PERMISSIONS, "Platform Specs": PLATFORMS, "Exclude Patterns": PATH_EXCLUDE_PATTERNS}
+    for label, values in pickers.items():
+        palette.set_source(label, entries(label, values, snapshot.licenses if values is items else {}))
+    swap_time = time_call(lambda: palette.set_source("Tags", entries("Tags", THEME_TAGS if len(palette.sources["Tags"]) == len(ADDON_TAGS) else ADDON_TAGS)), repeat=repeat)
+    print(f"Palette : {len(palette)} entries | swap tags {swap_time * 1000:8.3f} ms")
+    for query in queries + ("tags anim", "linux"):
+        query_time = time_call(lambda: palette.search(query), repeat=repeat)
+        results = palette.search(query)
+        top = results[0][1] if results else "-"
+        print(f"{query!r:28}: {query_time * 1000:8.3f} ms | {len(results):3} matches | top : {top}")
+    return True
+
+# Opt-in : times an after() heartbeat, a thread samples the Tk stack while it is late
+class StallWatchdog:
+    def __init__(self, root, threshold_ms=WATCHDOG_THRESHOLD_MS, heartbeat_ms=WATCHDOG_HEARTBEAT_MS):
+        self.root = root
+        self.threshold = threshold_ms / 1000
+        self.heartbeat = heartbeat_ms / 1000
+        self.main_id = threading.main_thread().ident
+        self.last_beat = time.perf_counter()
+        self.sample = None   # (Handler, Blocked At, Stack) of the current stall
+        self.running = False
+        self.lock = threading.Lock()
+        self.stalls = {}     # Handler : [count, total, max, bucket counts]
+        self.edges = [threshold_ms * scale for scale in WATCHDOG_BUCKETS] # Upper bucket edges in ms
+
+
+    def start(self):
+        self.running = True
+        self.last_beat = time.perf_counter()
+        self.root.after(int(self.heartbeat * 1000), self.__beat)
+        thread = threading.Thread(target=self.__watch, daemon=True)
+        thread.start()
+
+
+    def stop(self):
+        self.running = False
+
+
+    def __beat(self):
+        if not self.running:
+            return
+        now = time.perf_counter()
+        late = now - self.last_beat - self.heartbeat
+        with self.lock:
+            sample, self.sample = self.sample, None
+            self.last_beat = now
+        if late > self.threshold:
+            self.__record(late, sample)
+        self.root.after(int(self.heartbeat * 1000), self.__beat)
+
+
+    def __watch(self):
+        while self.running:
+            time.sleep(WATCHDOG_SAMPLE_MS / 1000)
+            with self.lock:
+                late = time.perf_counter() - self.last_beat - self.heartbeat
+                if late <= self.threshold:
+                    continue
+                frame = sys._current_frames().get(self.main_id)
+                if frame is not None:
+                    self.sample = self.describe(frame)
+
+
+    # Handler : first frame below Tk's dispatch, Blocked At : innermost frame
+    @staticmethod
+    def describe(frame):
+        frames = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        frames.reverse()
+        handler = None
+        inside_tk = False
+        for frame in frames:
+            in_tkinter = "tkinter" in Path(frame.f_code.co_filename).parts
+            if in_tkinter:
+                inside_tk = True
+            elif inside_tk:
+                handler = frame
+                break
+        handler = handler or frames[-1]
+        innermost = frames[-1]
+        name = getattr(handler.f_code, "co_qualname", handler.f_code.co_name)
+        blocked = f"{Path(innermost.f_code.co_filename).name}:{innermost.f_lineno} {innermost.f_code.co_name}"
+        stack = traceback.format_list(traceback.extract_stack(innermost))[-WATCHDOG_STACK_DEPTH:]
+        return name, blocked, stack
+
+
+    def __record(self, late, sample=None):
+        name, blocked, stack = sample or ("unknown", "not sampled", [])
+        print(f"STALL {late * 1000:7.1f} ms | {name} | at {blocked}")
+        if stack:
+            print("".join(stack).rstrip())
+        stats = self.stalls.setdefault(name, [0, 0.0, 0.0, [0] * (len(self.edges) + 1)])
+        stats[0] += 1
+        stats[1] += late
+        stats[2] = max(stats[2], late)
+        bucket = sum(1 for limit in self.edges if late * 1000 >= limit)
+        stats[3][bucket] += 1
+
+
+    def report(self):
+        if not self.stalls:
+            print(f"No stalls over {self.threshold * 1000:.0f} ms")
+            return
+        edges = [f"<{limit:g}" for limit in self.edges] + [f">={self.edges[-1]:g}"]
+        print(f"{'Handler':48} {'Count':>6} {'Total ms':>10} {'Max ms':>9} " + " ".join(f"{edge:>7}" for edge in edges))
+        for name, (count, total, longest, buckets) in sorted(self.stalls.items(), key=lambda item: -item[1][1]):
+            print(f"{name[:48]:48} {count:6} {total * 1000:10.1f} {longest * 1000:9.1f} " + " ".join(f"{bucket:7}" for bucket in buckets))
+
+# Opt-in : times widget callbacks, Tk bind handlers and manifest regeneration
+class HandlerProfiler:
+    def __init__(self, use_cprofile=False):
+        self.use_cprofile = use_cprofile
+        self.timings = {}   # Handler : array of seconds
+        self.profiles = {}  # Handler : cProfile.Profile
+        self.active = False # Only the outermost handler is profiled
+        self.originals = []
+
+
+    def install(self):
+        # Widgets bind while the app is built : patch before App()
+        bind = tk.Misc.bind
+        profiler = self
+        def profiled_bind(widget, sequence=None, func=None, add=None):
+            if callable(func):
+                func = profiler.wrap(f"{getattr(func, '__qualname__', repr(func))} {sequence}", func)
+            return bind(widget, sequence, func, add)
+        self.originals.append((tk.Misc, 'bind', bind))
+        tk.Misc.bind = profiled_bind
+
+        # command= options and register()ed validate commands : Tcl calls them through _register
+        register = tk.Misc._register
+        def profiled_register(widget, func, subst=None, needcleanup=1):
+            name = getattr(func, '__qualname__', repr(func))
+            # Bound handlers are wrapped already, after() timers only call the real target
+            if not getattr(func, 'profiled', False) and not name.startswith("Misc.after"):
+                func = profiler.wrap(f"command {name}", func)
+            return register(widget, func, subst, needcleanup)
+        self.originals.append((tk.Misc, '_register', register))
+        self.originals.append((tk.Misc, 'register', tk.Misc.register))
+        tk.Misc._register = tk.Misc.register = profiled_register
+
+        run_callback = UpdateScheduler.run_callback
+        def profiled_callback(callback, value):
+            name = getattr(callback, '__qualname__', repr(callback))
+            self.wrap(f"callback {name}", run_callback)(callback, value)
+        self.originals.append((UpdateScheduler, 'run_callback', staticmethod(run_callback)))
+        UpdateScheduler.run_callback = staticmethod(profiled_callback)
+
+        update_lines = DB.update_lines
+        self.originals.append((DB, 'update_lines', classmethod(update_lines.__func__)))
+        DB.update_lines = self.wrap("DB.update_lines", update_lines)
+
+        # One per idle tick : the whole typing path, callbacks and regeneration included
+        flush = UpdateScheduler.flush
+        self.originals.append((UpdateScheduler, 'flush', classmethod(flush.__func__)))
+        UpdateScheduler.flush = self.wrap("UpdateScheduler.flush", flush)
+
+
+    def uninstall(self):
+        while self.originals:
+            owner, name, original = self.originals.pop()
+            setattr(owner, name, original)
+
+
+    def wrap(self, name, func):
+        def profiled(*args, **kwargs):
+            profile = None
+            if self.use_cprofile and not self.active:
+                if name not in self.profiles:
+                    import cProfile
+                    self.profiles[name] = cProfile.Profile()
+                profile = self.profiles[name]
+                self.active = True
+                profile.enable()
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                if profile:
+                    profile.disable()
+                    self.active = False
+                timings = self.timings.get(name)
+                if timings is None:
+                    timings = self.timings[name] = array('d')
+                timings.append(elapsed)
+        profiled.profiled = True
+        return profiled
+
+
+    @staticmethod
+    def percentile(values, fraction):
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+    def report_lines(self):
+        lines = [f"{'Handler':64} {'Calls':>7} {'Total ms':>10} {'Avg ms':>8} {'P95 ms':>8} {'Max ms':>8}"]
+        for name, timings in sorted(self.timings.items(), key=lambda item: -sum(item[1])):
+            total = sum(timings)
+            lines.append(f"{name[:64]:64} {len(timings):7} {total * 1000:10.2f} {total / len(timings) * 1000:8.3f} {self.percentile(timings, 0.95) * 1000:8.3f} {max(timings) * 1000:8.3f}")
+        lines.append("")
+        lines.append(f"UpdateScheduler : marked {UpdateScheduler.MARKED} | coalesced {UpdateScheduler.COALESCED} | flushes {UpdateScheduler.FLUSHES}")
+        lines.append("Executor : " + " | ".join(f"{key} {value:.2f}" if isinstance(value, float) else f"{key} {value}" for key, value in EXECUTOR.stats().items()))
+        if self.profiles:
+            import io
+            import pstats
+            for name, profile in sorted(self.profiles.items()):
+                stream = io.StringIO()
+                stats = pstats.Stats(profile, stream=stream)
+                stats.sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+                lines.append("")
+                lines.append(f"---- {name} ----")
+                lines.extend(line for line in stream.getvalue().splitlines() if line.strip())
+        return lines
+
+
+    @try_except_decorator
+    def write(self, report_path=PROFILE_REPORT_FILE):
+        report_path = Path(report_path)
+        report_path.write_text("\n".join(self.report_lines()) + "\n", encoding="utf-8")
+        print(f"Profile report : {report_path}")
+        if self.profiles:
+            import pstats
+            stats = pstats.Stats(*self.profiles.values())
+            stats_path = report_path.with_suffix(".pstats")
+            stats.dump_stats(stats_path)
+            print(f"Profile stats : {stats_path}")
 
 ########################•########################
 """                APPLICATION                """
 ########################•########################
 
 class App(tk.Tk):
-    def __init__(self):
+    def __init__(self, lazy=APP_LAZY_TABS):
         super().__init__()
         root = self
+        # Props
+        self.lazy = lazy
+        self.licenses = {}
+        self.licenses_loaded = False
+        self.licenses_status = "Loading..."
+        self.license_pick = None
+        self.detected_source_dir = None
+        self.detected_licenses = set()
+        self.detect_job = None
+        self.command_job = None
+        self.manifest_job = None
+        self.loaded_manifest = None # (File path, (mtime_ns, size)) last applied
+        self.tags_pick = None
+        self.manifest_textbox = None
+        self.validate_textbox = None
+        self.build_textbox = None
         # Window
         root.title(APP_NAME)
         root.resizable(APP_RESIZABLE, APP_RESIZABLE)
@@ -1185,15 +3961,52 @@ class App(tk.Tk):
         # Build
         self.build_frame_1(frame_1)
         self.build_frame_2(frame_2)
-        self.build_callbacks()
+        # Workers
+        EXECUTOR.attach(self)
+        # Previews : widget defaults are in the manifest, every section once
+        UpdateScheduler.LISTENERS.append(self.refresh_previews)
+        DB.mark_all_dirty()
+        DB.update_lines()
+        self.refresh_previews()
+        # Command Palette
+        self.palette = CommandPalette(self)
+        self.bind("<Control-p>", self.open_palette)
+        self.bind("<Control-P>", self.open_palette)
+        # Undo / Redo
+        self.bind("<Control-z>", self.undo)
+        self.bind("<Control-Shift-Z>", self.redo)
+        # Load
+        self.load_licenses()
+        # Lazy : remaining tabs once the window is up
+        if self.lazy:
+            self.after(LAZY_TABS_DELAY_MS, self.__build_pending_tabs)
 
 
     def build_frame_1(self, frame):
         # Tabs
-        self.info_tabs = TabsWidget(frame, row=0, column=0, tab_names=["Paths", "Extension", "Versions", "Developer", "Legal", "Platform", "Dependencies"])
+        builders = {
+            "Paths"        : self.build_paths_tab,
+            "Extension"    : self.build_extension_tab,
+            "Versions"     : self.build_versions_tab,
+            "Developer"    : self.build_developer_tab,
+            "Legal"        : self.build_legal_tab,
+            "Platform"     : self.build_platform_tab,
+            "Dependencies" : self.build_dependencies_tab,
+        }
+        self.info_tabs = TabsWidget(frame, row=0, column=0, tab_names=list(builders.keys()), builders=builders, lazy=self.lazy)
+
+
+    def build_frame_2(self, frame):
+        # Tabs
+        builders = {
+            "Manifest" : self.build_manifest_tab,
+            "Validate" : self.build_validate_tab,
+            "Build"    : self.build_build_tab,
+        }
+        self.builder_tabs = TabsWidget(frame, row=0, column=0, tab_names=list(builders.keys()), builders=builders, lazy=self.lazy)
+
 
-        # Paths
-        tab = self.info_tabs.get_tab_frame(tab_name="Paths")
+    def build_paths_tab(self, tab):
         tab.columnconfigure(0, weight=1, minsize=LABEL_WIDTH)
         tab.rowconfigure(0, weight=1)
         tab.rowconfigure(1, weight=1)
@@ -1201,23 +4014,40 @@ class App(tk.Tk):
         self.blender_picker = FolderPickerWidget(tab, key='BLENDER_EXE_PATH', required=True, row=0, column=0, label_text="Blender Exe Path", pick_mode='EXE')
         self.source_picker  = FolderPickerWidget(tab, key='SOURCE_DIR'      , required=True, row=1, column=0, label_text="Source Directory", pick_mode='DIR')
         self.build_picker   = FolderPickerWidget(tab, key='BUILD_DIR'       , required=True, row=2, column=0, label_text="Build Directory" , pick_mode='DIR')
+        # Callbacks
+        self.source_picker.callbacks.append(self.load_source_manifest)
+        self.source_picker.callbacks.append(self.detect_source_licenses)
+
 
-        # Extension
-        tab = self.info_tabs.get_tab_frame(tab_name="Extension")
+    def build_extension_tab(self, tab):
         tab.columnconfigure(0, weight=1, minsize=LABEL_WIDTH)
         tab.rowconfigure(0, weight=1)
         tab.rowconfigure(1, weight=1)
         tab.rowconfigure(2, weight=1)
         tab.rowconfigure(3, weight=1)
         tab.rowconfigure(4, weight=1)
-        self.id_entry      = EntryWidget    (tab, key='ID'     , required=True , row=0, column=0, label_text="ID", char_modifiers=[CharsReplacer(filter_map={" ":"_"})])
+        self.id_entry      = EntryWidget    (tab, key='ID'     , required=True , row=0, column=0, label_text="ID")
         self.name_entry    = EntryWidget    (tab, key='NAME'   , required=True , row=1, column=0, label_text="Name")
-        self.tagline_entry = EntryWidget    (tab, key='TAGLINE', required=True , row=2, column=0, label_text="Tagline", char_modifiers=[CharsLimiter(limit=64)])
+        self.tagline_entry = EntryWidget    (tab, key='TAGLINE', required=True , row=2, column=0, label_text="Tagline")
         self.type_dropdown = DropdownWidget (tab, key='TYPE'   , required=True , row=3, column=0, label_text="Type", options=EXTENSION_TYPES, default="add-on")
-        self.tags_pick     = ListPickWidget (tab, key='TAGS'   , required=False, row=4, column=0, label_text="Tags", items=ADDON_TAGS)
+        self.tags_pick     = ListPickWidget (tab, key='TAGS'   , required=False, row=4, column=0, label_text="Tags", items=THEME_TAGS if self.type_dropdown.get_value() == "theme" else ADDON_TAGS)
+        # Callbacks
+        self.type_dropdown.callbacks.append(self.switch_tags)
 
-        # Versions
-        tab = self.info_tabs.get_tab_frame(tab_name="Versions")
+
+    def switch_tags(self, value):
+        if not self.tags_pick or not isinstance(value, str):
+            return
+        items = {"add-on": ADDON_TAGS, "theme": THEME_TAGS}.get(value)
+        # Unchanged type : keep the list and its selection
+        if items is None or self.tags_pick.list.items == items:
+            return
+        self.tags_pick.external_update_list(items=items, keep_selection=True)
+        # Tags missing from the new list were dropped : push the survivors
+        self.tags_pick.invoke_update()
+
+
+    def build_versions_tab(self, tab):
         tab.columnconfigure(0, weight=1, minsize=LABEL_WIDTH)
         tab.rowconfigure(0, weight=1)
         tab.rowconfigure(1, weight=1)
@@ -1230,8 +4060,8 @@ class App(tk.Tk):
         # Config
         self.schema_version.disable()
 
-        # Developer
-        tab = self.info_tabs.get_tab_frame(tab_name="Developer")
+
+    def build_developer_tab(self, tab):
         tab.columnconfigure(0, weight=1, minsize=LABEL_WIDTH)
         tab.rowconfigure(0, weight=1)
         tab.rowconfigure(1, weight=1)
@@ -1240,24 +4070,29 @@ class App(tk.Tk):
         self.dev_email_entry = EntryWidget(tab, key='EMAIL'     , required=False, row=1, column=0, label_text="Maintainer Email"  )
         self.dev_web_entry   = EntryWidget(tab, key='WEBSITE'   , required=False, row=2, column=0, label_text="Maintainer Website")
 
-        # Legal
-        tab = self.info_tabs.get_tab_frame(tab_name="Legal")
+
+    def build_legal_tab(self, tab):
         tab.columnconfigure(0, weight=1, minsize=LABEL_WIDTH)
         tab.rowconfigure(0, weight=1)
         tab.rowconfigure(1, weight=1)
-        self.license_pick    = ListPickWidget(tab, key='LICENSE'  , required=True , row=0, column=0, label_text="License(s)", items=LICENSES.keys())
-        self.copyright_entry = ListPickWidget(tab, key='COPYRIGHT', required=False, row=1, column=0, label_text="Copyright", items=LICENSES.keys())
+        self.license_pick   = ListPickWidget (tab, key='LICENSE'  , required=True , row=0, column=0, label_text="License(s)", items=[])
+        self.copyright_list = EntryListWidget(tab, key='COPYRIGHT', required=False, row=1, column=0, label_text="Copyright")
+        # Init
+        if self.licenses_loaded:
+            self.__apply_licenses()
+        else:
+            self.license_pick.set_loading(text=self.licenses_status)
+
 
-        # Platform
-        tab = self.info_tabs.get_tab_frame(tab_name="Platform")
+    def build_platform_tab(self, tab):
         tab.columnconfigure(0, weight=1, minsize=LABEL_WIDTH)
         tab.rowconfigure(0, weight=1)
         tab.rowconfigure(1, weight=1)
-        self.permission     = ListPickWidget (tab, key='PERMISSIONS', required=False, row=0, column=0, label_text="Permissions", items=PLATFORMS)
+        self.permission     = ListPickWidget (tab, key='PERMISSIONS', required=False, row=0, column=0, label_text="Permissions", items=PERMISSIONS)
         self.platforms_pick = ListPickWidget (tab, key='PLATFORMS'  , required=False, row=1, column=0, label_text="Platform Specs", items=PLATFORMS)
 
-        # Dependencies
-        tab = self.info_tabs.get_tab_frame(tab_name="Dependencies")
+
+    def build_dependencies_tab(self, tab):
         tab.columnconfigure(0, weight=1, minsize=LABEL_WIDTH)
         tab.rowconfigure(0, weight=1)
         tab.rowconfigure(1, weight=1)
@@ -1267,44 +4102,338 @@ class App(tk.Tk):
         self.exclude_patterns = ListPickWidget (tab, key='EXCLUDE_PATTERNS', required=False, row=2, column=0, label_text="Exclude Patterns", items=PATH_EXCLUDE_PATTERNS)
 
 
-    def build_frame_2(self, frame):
-        # Tabs
-        self.builder_tabs = TabsWidget(frame, row=0, column=0, tab_names=["Manifest", "Validate", "Build"])
-
-        # Manifest
-        tab = self.builder_tabs.get_tab_frame(tab_name="Manifest")
+    def build_manifest_tab(self, tab):
         tab.columnconfigure(0, weight=1, minsize=LABEL_WIDTH)
         tab.rowconfigure(0, weight=1)
-        self.manifest_textbox = TextBoxWidget(tab, row=0, column=0, label_text="Preview")
-        self.manifest_textbox.set_value([f"This is a line {i}" for i in range(100)])
+        self.manifest_textbox = TextBoxWidget(tab, row=0, column=0, label_text="Preview", syntax='TOML')
+        self.save_btn         = tk.Button(tab, text="Save Manifest", command=self.save_manifest)
+        # Position
+        self.save_btn.grid(row=1, column=0, sticky="e", padx=PADX, pady=PADY)
+        # Config
+        config_widget(self.save_btn)
+        # Init
+        self.refresh_previews()
+
 
-        # Validate Command
-        tab = self.builder_tabs.get_tab_frame(tab_name="Validate")
+    def build_validate_tab(self, tab):
         tab.columnconfigure(0, weight=1, minsize=LABEL_WIDTH)
         tab.rowconfigure(0, weight=1)
-        self.manifest_textbox = TextBoxWidget(tab, row=0, column=0, label_text="Command")
-        self.manifest_textbox.set_value([f"This is a line {i}" for i in range(100)])
+        tab.rowconfigure(2, weight=1)
+        self.validate_textbox = TextBoxWidget(tab, row=0, column=0, label_text="Command")
+        self.validate_btn     = tk.Button(tab, text="Validate", command=lambda: self.check_then_run(DB.VALIDATE_LINES, self.validate_log))
+        self.validate_log     = LogWidget(tab, row=2, column=0, label_text="Output")
+        # Position
+        self.validate_btn.grid(row=1, column=0, sticky="e", padx=PADX, pady=PADY)
+        # Config
+        config_widget(self.validate_btn)
+        # Init
+        self.refresh_previews()
+
 
-        # Build Command
-        tab = self.builder_tabs.get_tab_frame(tab_name="Build")
+    def build_build_tab(self, tab):
         tab.columnconfigure(0, weight=1, minsize=LABEL_WIDTH)
         tab.rowconfigure(0, weight=1)
-        self.manifest_textbox = TextBoxWidget(tab, row=0, column=0, label_text="Command")
-        self.manifest_textbox.set_value([f"This is a line {i}" for i in range(100)])
+        tab.rowconfigure(2, weight=1)
+        self.build_textbox = TextBoxWidget(tab, row=0, column=0, label_text="Command")
+        self.build_btn     = tk.Button(tab, text="Build", command=lambda: self.check_then_run(DB.BUILD_LINES, self.build_log))
+        self.build_log     = LogWidget(tab, row=2, column=0, label_text="Output")
+        # Position
+        self.build_btn.grid(row=1, column=0, sticky="e", padx=PADX, pady=PADY)
+        # Config
+        config_widget(self.build_btn)
+        # Init
+        self.refresh_previews()
+
+
+    def refresh_previews(self):
+        # Only the lines that changed are replaced and re-highlighted
+        for textbox, lines in ((self.manifest_textbox, DB.MANIFEST_LINES), (self.validate_textbox, DB.VALIDATE_LINES), (self.build_textbox, DB.BUILD_LINES)):
+            if textbox:
+                textbox.update_lines(lines)
+
+
+    def save_manifest(self):
+        # Pending edits land in the manifest first
+        if UpdateScheduler.PENDING:
+            UpdateScheduler.flush()
+        if not DB.MANI_FILE_PATH:
+            messagebox.showwarning("Warning", "Select a valid source directory first.")
+            return
+        self.__write_manifest()
+
+
+    # Returns True once the file on disk holds the form
+    def __write_manifest(self):
+        file_path = DB.MANI_FILE_PATH
+        if is_manifest_saved(DB.MANIFEST_LINES, file_path):
+            print(f"Unchanged : {file_path}")
+            return True
+        # Edited outside the tool, or never loaded : replacing it is confirmed
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            stat = None
+        if stat and (str(file_path), (stat.st_mtime_ns, stat.st_size)) != self.loaded_manifest:
+            if not messagebox.askyesno("Replace Manifest", f"{file_path}\ndiffers from the manifest loaded in the tool. Replace it?"):
+                return False
+        if write_manifest(lines=DB.MANIFEST_LINES, file_path=file_path) is None:
+            messagebox.showerror("Error", f"Could not write {file_path}")
+            return False
+        # Saved here : refocus does not reload it, the next save does not ask
+        stat = os.stat(file_path)
+        self.loaded_manifest = (str(file_path), (stat.st_mtime_ns, stat.st_size))
+        print(f"Saved : {file_path}")
+        return True
+
+
+    def open_palette(self, event=None):
+        # Every field is indexed once its tab is built
+        self.info_tabs.build_all()
+        return self.palette.open(event)
+
+
+    def undo(self, event=None):
+        History.undo()
+        return "break"
+
+
+    def redo(self, event=None):
+        History.redo()
+        return "break"
+
+
+    def __build_pending_tabs(self):
+        if self.info_tabs.build_next() or self.builder_tabs.build_next():
+            self.after(LAZY_TABS_DELAY_MS, self.__build_pending_tabs)
+
+
+    def load_licenses(self):
+        self.licenses_loaded = False
+        self.licenses_status = "Loading..."
+        if self.license_pick:
+            self.license_pick.set_loading(text=self.licenses_status)
+        # Job : fetch + parse off the Tk thread, each published list arrives as progress
+        EXECUTOR.submit(self.__licenses_job, on_progress=self.__licenses_progress, on_done=self.__licenses_done)
+
+
+    def __licenses_job(self):
+        set_licenses(on_update=current_job().progress)
+
+
+    def __licenses_progress(self, updates=[]):
+        # Only the newest result matters
+        licenses = updates[-1]
+        if licenses:
+            keep_selection = self.licenses_loaded
+            self.licenses = licenses
+            self.licenses_loaded = True
+            self.__apply_licenses(keep_selection=keep_selection)
+
+
+    def __licenses_done(self, result=None):
+        if not self.licenses_loaded:
+            self.licenses_status = "Licenses unavailable"
+            if self.license_pick:
+                self.license_pick.set_loading(text=self.licenses_status)
+
+
+    def __apply_licenses(self, keep_selection=False):
+        if not self.license_pick:
+            return
+        items = list(self.licenses.keys())
+        aliases = {name: value.removeprefix("SPDX:") for name, value in self.licenses.items()}
+        # Picker shows names, the manifest stores SPDX values
+        self.license_pick.external_update_list(items=items, keep_selection=keep_selection, aliases=aliases, values=self.licenses)
+        self.__select_detected_licenses()
+
+
+    def load_source_manifest(self, source_dir):
+        if not source_dir:
+            return
+        if self.manifest_job:
+            self.manifest_job.cancel()
+        # Job : stat + parse off the Tk thread, unchanged files come from the cache
+        file_path = Path(source_dir).joinpath(DB.MANI_FILE_NAME)
+        self.manifest_job = EXECUTOR.submit(MANIFEST_CACHE.load, file_path, priority=PRIORITY_HIGH, on_done=self.__manifest_done)
+
+
+    def __manifest_done(self, result=None):
+        self.manifest_job = None
+        if not result:
+            return
+        file_path, key, manifest = result
+        # Refocus : the same file is applied once, a stale source is ignored
+        if (file_path, key) == self.loaded_manifest:
+            return
+        if not DB.MANIFEST.SOURCE_DIR or str(Path(DB.MANIFEST.SOURCE_DIR).joinpath(DB.MANI_FILE_NAME)) != file_path:
+            return
+        self.loaded_manifest = (file_path, key)
+        self.switch_tags(manifest.TYPE)
+        values = [(field, getattr(manifest, field)) for field in Manifest.FIELDS if field not in Manifest.PATHS]
+        # One batched pass : DB, widgets, a single flush, one undo step
+        History.apply(values)
+        print(f"Loaded : {file_path}")
+
+
+    def detect_source_licenses(self, source_dir):
+        # Known missing : skip, unknown ones are checked by the scan on the worker
+        if not source_dir or source_dir == self.detected_source_dir or PATH_CACHE.get(source_dir, 'DIR') is False:
+            return
+        self.detected_source_dir = source_dir
+        self.detected_licenses = set()
+        # Stale : source changed while scanning
+        if self.detect_job:
+            self.detect_job.cancel()
+        # Job : file reads + matching off the Tk thread
+        self.detect_job = EXECUTOR.submit(detect_licenses, source_dir, on_done=self.__detect_done)
+
+
+    def __detect_done(self, detections=None):
+        self.detect_job = None
+        detections = detections or []
+        self.detected_licenses = {identifier for identifier, _, _ in detections}
+        if self.detected_licenses:
+            print(f"Detected licenses : {', '.join(sorted(self.detected_licenses))}")
+        self.__select_detected_licenses()
+
+
+    def __select_detected_licenses(self):
+        if not self.detected_licenses or not self.licenses_loaded or not self.license_pick:
+            return
+        values = [value for value in self.licenses.values() if value.removeprefix("SPDX:") in self.detected_licenses]
+        self.license_pick.external_select(values=values)
+
+
+    # In process first : Blender only confirms a manifest that already passes
+    def check_then_run(self, command=[], log=None):
+        if self.command_job:
+            log.append(["Warning : A command is already running"])
+            return
+        if UpdateScheduler.PENDING:
+            UpdateScheduler.flush()
+        if not DB.MANI_FILE_PATH:
+            log.clear()
+            log.append(["Error : Select a valid source directory first"])
+            return
+        # The form as rendered : checked in memory, nothing is written
+        start = time.perf_counter()
+        errors = check_manifest_lines(DB.MANIFEST_LINES, source_dir=DB.MANIFEST.SOURCE_DIR)
+        elapsed = (time.perf_counter() - start) * 1000
+        # Blender reads the file on disk : unsaved edits are only written when the user says so
+        if not errors and not is_manifest_saved(DB.MANIFEST_LINES, DB.MANI_FILE_PATH):
+            save = messagebox.askyesnocancel("Unsaved Manifest", f"Save {DB.MANI_FILE_NAME} before running Blender?\nNo runs Blender on the file as it is on disk.")
+            if save is None:
+                return
+            if save and not self.__write_manifest():
+                return
+            if not save:
+                start = time.perf_counter()
+                errors = check_manifest_file(DB.MANI_FILE_PATH, source_dir=DB.MANIFEST.SOURCE_DIR)
+                elapsed += (time.perf_counter() - start) * 1000
+        if errors:
+            log.clear()
+            log.append([f"Error : {field} {message}" for field, message in errors] + [f"Manifest : {len(errors)} errors in {elapsed:.1f} ms, Blender not started"])
+            return
+        self.run_command(command, log)
+        log.append([f"Manifest : checks passed in {elapsed:.1f} ms"])
+
+
+    def run_command(self, command=[], log=None):
+        if self.command_job:
+            log.append(["Warning : A command is already running"])
+            return
+        log.clear()
+        if not command:
+            log.append(["Error : Set the Blender executable and the source / build directories first"])
+            return
+        log.append([f"> {subprocess.list2cmdline(command)}"])
+        # Job : output lines arrive batched per tick
+        self.command_job = EXECUTOR.submit(self.__command_job, list(command), on_progress=log.append, on_done=self.__command_done)
+
+
+    def __command_job(self, command):
+        job = current_job()
+        lines = run_command(command)
+        for line in lines:
+            if job.cancelled:
+                lines.close()
+                return
+            job.progress(line)
+
 
+    def __command_done(self, result=None):
+        self.command_job = None
 
-    def build_callbacks(self):
 
-        def switch_tags(value):
-            if isinstance(value, str):
-                if value == "add-on":
-                    self.tags_pick.external_update_list(items=ADDON_TAGS)
-                elif value == "theme":
-                    self.tags_pick.external_update_list(items=THEME_TAGS)
-        self.type_dropdown.callbacks.append(switch_tags)
+    def destroy(self):
+        # Running commands are killed rather than left orphaned
+        if self.command_job:
+            self.command_job.cancel()
+        super().destroy()
 
 
 if __name__ == "__main__":
-    set_licenses()
-    app = App()
-    app.mainloop()
+    parser = argparse.ArgumentParser(description=APP_NAME)
+    parser.add_argument("--update-licenses", metavar="SOURCE", nargs="?", const=LICENSES_URL, help="Rebuild the bundled SPDX snapshot from a licenses.json URL or file")
+    parser.add_argument("--bench-licenses", metavar="HTML", nargs="?", const="", help="Compare snapshot loading with scraping the SPDX HTML table")
+    parser.add_argument("--bench-search", action="store_true", help="Time license search index build and queries")
+    parser.add_argument("--update-fingerprints", metavar="TEXT_DIR", help="Rebuild the license detection index from a folder of SPDX license texts")
+    parser.add_argument("--detect-licenses", metavar="SOURCE_DIR", help="Print the licenses detected in an add-on folder")
+    parser.add_argument("--bench-startup", metavar="BUDGET_MS", nargs="?", type=int, const=STARTUP_BUDGET_MS, help="Time cold launches to interactive, fail when over budget")
+    parser.add_argument("--startup-probe", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--eager", action="store_true", help="Build every tab up front")
+    parser.add_argument("--check-manifest", metavar="PATH", help="Check a blender_manifest.toml (or the source directory holding it) without Blender")
+    parser.add_argument("--profile", metavar="REPORT", nargs="?", const=PROFILE_REPORT_FILE, help="Time GUI handlers and write a report on exit")
+    parser.add_argument("--cprofile", action="store_true", help="With --profile : cProfile each handler and write a .pstats file")
+    parser.add_argument("--watchdog", metavar="THRESHOLD_MS", nargs="?", type=int, const=WATCHDOG_THRESHOLD_MS, help="Log UI stalls with the blocking stack, print a histogram on exit")
+    args = parser.parse_args()
+
+    if args.update_licenses:
+        build_license_snapshot(source=args.update_licenses)
+    elif args.bench_licenses is not None:
+        benchmark_licenses(html_path=args.bench_licenses or None)
+    elif args.bench_search:
+        benchmark_search()
+    elif args.update_fingerprints:
+        build_license_fingerprints(source_dir=args.update_fingerprints)
+    elif args.detect_licenses:
+        start = time.perf_counter()
+        detections = detect_licenses(args.detect_licenses) or []
+        for identifier, file_path, score in detections:
+            print(f"{identifier:32} {score:5.2f}  {file_path}")
+        print(f"{len(detections)} detections in {(time.perf_counter() - start) * 1000:.1f} ms")
+    elif args.check_manifest:
+        target = Path(args.check_manifest)
+        source_dir = target if target.is_dir() else target.parent
+        file_path = target.joinpath(DB.MANI_FILE_NAME) if target.is_dir() else target
+        start = time.perf_counter()
+        errors = check_manifest_file(file_path, source_dir=source_dir)
+        for field, message in errors:
+            print(f"Error : {field} {message}")
+        print(f"{file_path} : {len(errors)} errors in {(time.perf_counter() - start) * 1000:.1f} ms")
+        sys.exit(1 if errors else 0)
+    elif args.bench_startup is not None:
+        sys.exit(0 if benchmark_startup(budget_ms=args.bench_startup, eager=args.eager) else 1)
+    elif args.startup_probe:
+        app = App(lazy=not args.eager)
+        app.update()
+        heavy = [name for name in ("requests", "bs4") if name in sys.modules]
+        print(f"READY app ready {(time.perf_counter() - START_TIME) * 1000:.1f} ms after imports | heavy modules : {', '.join(heavy) or 'none'}", flush=True)
+        app.destroy()
+    else:
+        profiler = None
+        if args.profile:
+            profiler = HandlerProfiler(use_cprofile=args.cprofile)
+            profiler.install()
+        app = App(lazy=not args.eager)
+        watchdog = None
+        if args.watchdog:
+            watchdog = StallWatchdog(app, threshold_ms=args.watchdog)
+            watchdog.start()
+        app.mainloop()
+        if watchdog:
+            watchdog.stop()
+            watchdog.report()
+        if profiler:
+            profiler.uninstall()
+            profiler.write(args.profile)
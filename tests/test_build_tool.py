@@ -0,0 +1,410 @@
+import os
+import sys
+import json
+import socket
+import threading
+import tomllib
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import build_tool as bt
+
+########################•########################
+"""                  MANIFEST                 """
+########################•########################
+
+def make_manifest(**values):
+    fields = {
+        'ID'                  : "quote_test",
+        'NAME'                : 'Say "Hi" \\ Grüße ✓',
+        'TAGLINE'             : "Tabs\tand \\n are text, DEL \x7f too",
+        'TYPE'                : "add-on",
+        'TAGS'                : ["Animation", "3D View"],
+        'SCHEMA_VERSION'      : (1, 0, 0),
+        'VERSION'             : (1, 2, 3),
+        'BLENDER_VERSION_MIN' : (4, 2, 0),
+        'BLENDER_VERSION_MAX' : (5, 0, 1),
+        'MAINTAINER'          : "Zoë O'Brien",
+        'EMAIL'               : "zoe@example.com",
+        'WEBSITE'             : "https://example.com/ä?q=\"x\"",
+        'LICENSE'             : ["SPDX:GPL-3.0-or-later", "SPDX:MIT"],
+        'COPYRIGHT'           : ["2020-2024 Jürgen \"JJ\" Müller", "2024 C:\\Users\\日本"],
+        'PERMISSIONS'         : [("files", "Reads \"*.blend\" files"), ("network", "Downloads HDRIs from Poly Haven")],
+        'PLATFORMS'           : ["windows-x64", "linux-x64"],
+        'WHEELS'              : ["./wheels/päckage-1.0-py3-none-any.whl"],
+        'INCLUDE_PATHS'       : ["__init__.py", "data\\icons"],
+    }
+    fields.update(values)
+    return bt.Manifest(**fields)
+
+
+def test_write_manifest_round_trip(tmp_path):
+    manifest = make_manifest()
+    file_path = tmp_path / "blender_manifest.toml"
+    assert bt.write_manifest(bt.DB.manifest_lines(manifest), file_path) is True
+    with open(file_path, "rb") as file:
+        data = tomllib.load(file)
+    assert data["name"] == manifest.NAME
+    assert data["tagline"] == manifest.TAGLINE
+    assert data["copyright"] == list(manifest.COPYRIGHT)
+    assert data["maintainer"] == f"{manifest.MAINTAINER} <{manifest.EMAIL}>"
+    assert data["build"]["paths"] == list(manifest.INCLUDE_PATHS)
+
+
+def test_parse_manifest_matches_original(tmp_path):
+    manifest = make_manifest()
+    file_path = tmp_path / "blender_manifest.toml"
+    bt.write_manifest(bt.DB.manifest_lines(manifest), file_path)
+    parsed = bt.parse_manifest(tomllib.loads(file_path.read_text(encoding="utf-8")))
+    assert parsed.diff(manifest) == []
+
+
+def test_parse_manifest_keeps_permission_reasons():
+    data = tomllib.loads('[permissions]\nnetwork = "Downloads HDRIs from Poly Haven"\nfiles = "Imports images"\n')
+    manifest = bt.parse_manifest(data)
+    assert manifest.PERMISSIONS == (("network", "Downloads HDRIs from Poly Haven"), ("files", "Imports images"))
+    assert bt.DB.section_permissions(manifest)[2] == 'network = "Downloads HDRIs from Poly Haven"'
+
+
+# Stands in for a picker : only offers some values, the rest read back as missing
+class PickerStub:
+    def __init__(self, key, offered=()):
+        self.key = key
+        self.callbacks = []
+        self.offered = offered
+        self.value = []
+        self.parent = self
+
+    def set_value(self, values=[]):
+        self.value = [value for value in values or [] if value in self.offered]
+
+    def get_value(self):
+        return list(self.value)
+
+    def after_idle(self, callback):
+        pass
+
+
+@pytest.fixture
+def history(monkeypatch):
+    monkeypatch.setattr(bt.History, "UNDO", bt.deque(maxlen=bt.HISTORY_MAX_STEPS))
+    monkeypatch.setattr(bt.History, "REDO", [])
+    monkeypatch.setattr(bt.History, "FROZEN", {})
+    monkeypatch.setattr(bt.History, "WIDGETS", {})
+    monkeypatch.setattr(bt.History, "STEP", {})
+    monkeypatch.setattr(bt.UpdateScheduler, "PENDING", {})
+    monkeypatch.setattr(bt.UpdateScheduler, "SCHEDULED", True)
+    monkeypatch.setattr(bt.DB, "MANIFEST", bt.Manifest())
+    monkeypatch.setattr(bt.DB, "DIRTY", set())
+    return bt.History
+
+
+def test_history_apply_records_read_back_values(history):
+    history.WIDGETS['TAGS'] = PickerStub('TAGS', offered=("Animation",))
+    history.apply([('TAGS', ["Animation", "Unknown"]), ('NAME', "Loaded")])
+    assert bt.DB.MANIFEST.TAGS == ("Animation",)
+    assert history.UNDO[-1] == (('TAGS', None, ("Animation",)), ('NAME', None, "Loaded"))
+    history.undo()
+    assert bt.DB.MANIFEST.TAGS == () and bt.DB.MANIFEST.NAME is None
+    history.redo()
+    assert bt.DB.MANIFEST.TAGS == ("Animation",) and bt.DB.MANIFEST.NAME == "Loaded"
+
+
+def test_keyless_widgets_schedule_no_flush(history):
+    preview = PickerStub('')
+    bt.Base.invoke_update(preview)
+    assert bt.UpdateScheduler.PENDING == {}
+    field = PickerStub('NAME')
+    bt.Base.invoke_update(field)
+    assert list(bt.UpdateScheduler.PENDING) == [field]
+
+
+def test_manifest_assignments_fire_change_events():
+    manifest = bt.Manifest()
+    changes = []
+    manifest.on_change(callback=lambda key, old, new: changes.append((key, old, new)))
+    manifest.NAME = "A"
+    manifest.NAME = "A"
+    manifest.LICENSE = ["SPDX:MIT"]
+    assert changes == [('NAME', None, "A"), ('LICENSE', None, ("SPDX:MIT",))]
+
+
+def test_license_lines_write_stored_values():
+    # The model holds SPDX values : written as is, whatever the picker shows
+    manifest = bt.Manifest(LICENSE=["SPDX:MIT", "SPDX:LicenseRef-Studio"])
+    assert bt.DB.manifest_lines(manifest) == ["license = [", '\t"SPDX:MIT",', '\t"SPDX:LicenseRef-Studio",', "]"]
+
+
+def test_write_manifest_unchanged_keeps_mtime(tmp_path):
+    file_path = tmp_path / "blender_manifest.toml"
+    lines = bt.DB.manifest_lines(make_manifest())
+    assert bt.write_manifest(lines, file_path) is True
+    os.utime(file_path, ns=(1_000_000_000, 1_000_000_000))
+    assert bt.write_manifest(lines, file_path) is False
+    assert file_path.stat().st_mtime_ns == 1_000_000_000
+    # Changed : written again
+    assert bt.write_manifest(bt.DB.manifest_lines(make_manifest(NAME="Other")), file_path) is True
+    assert file_path.stat().st_mtime_ns != 1_000_000_000
+
+########################•########################
+"""                   CHECKS                  """
+########################•########################
+
+def valid_manifest(**values):
+    data = {
+        "schema_version": "1.0.0",
+        "id": "my_addon",
+        "name": "My Add-on",
+        "version": "1.2.3",
+        "tagline": "Does one thing well",
+        "maintainer": "Zoë <zoe@example.com>",
+        "type": "add-on",
+        "tags": ["Animation"],
+        "license": ["SPDX:GPL-3.0-or-later"],
+        "copyright": ["2024 Zoë"],
+        "blender_version_min": "4.2.0",
+        "platforms": ["linux-x64"],
+        "permissions": {"network": "Downloads HDRIs from Poly Haven"},
+        "build": {"paths": ["__init__.py"]},
+    }
+    data.update(values)
+    return {key: value for key, value in data.items() if value is not None}
+
+
+def test_check_manifest_valid():
+    assert bt.check_manifest(valid_manifest()) == []
+    assert bt.check_manifest_lines(bt.DB.manifest_lines(bt.Manifest(SCHEMA_VERSION=(1, 0, 0), ID="my_addon", NAME="A", VERSION=(1, 0, 0), TAGLINE="Short", MAINTAINER="Zoë", TYPE="theme", LICENSE=["SPDX:MIT"], BLENDER_VERSION_MIN=(4, 2, 0)))) == []
+
+
+@pytest.mark.parametrize("values, field", [
+    # Identity
+    ({"id": None}, "id"),
+    ({"id": "my-addon"}, "id"),
+    ({"id": "1addon"}, "id"),
+    ({"id": "my__addon"}, "id"),
+    ({"id": "_addon"}, "id"),
+    # Tagline : 64 characters, ends with a letter, a digit or a closing bracket
+    ({"tagline": "x" * 65}, "tagline"),
+    ({"tagline": "Does one thing."}, "tagline"),
+    ({"tagline": "Does one thing…"}, "tagline"),
+    ({"tagline": "一つのこと。"}, "tagline"),
+    ({"tagline": " Padded"}, "tagline"),
+    ({"tagline": "Line\nbreak"}, "tagline"),
+    # Versions
+    ({"version": "1.2"}, "version"),
+    ({"schema_version": "1.1.0"}, "schema_version"),
+    ({"blender_version_min": "4.1.0"}, "blender_version_min"),
+    ({"blender_version_max": "4.2.0"}, "blender_version_max"),
+    # Tags per type
+    ({"tags": ["Dark"]}, "tags"),
+    ({"type": "theme", "tags": ["Animation"]}, "tags"),
+    ({"type": "script"}, "type"),
+    # Licenses
+    ({"license": ["GPL-3.0-or-later"]}, "license"),
+    ({"license": ["SPDX:"]}, "license"),
+    ({"license": []}, "license"),
+    ({"copyright": ["Zoë 2024"]}, "copyright"),
+    # Permission reasons
+    ({"permissions": {"network": "Downloads HDRIs."}}, "permissions.network"),
+    ({"permissions": {"network": ""}}, "permissions.network"),
+    ({"permissions": {"network": "x" * 65}}, "permissions.network"),
+    ({"permissions": {"printer": "Prints"}}, "permissions"),
+    # Platforms
+    ({"platforms": ["linux-arm64"]}, "platforms"),
+    ({"platforms": "linux-x64"}, "platforms"),
+    # Build paths
+    ({"build": {"paths": ["__init__.py"], "paths_exclude_pattern": ["*.pyc"]}}, "build"),
+    ({"build": {"paths": ["../outside.py"]}}, "build.paths"),
+    ({"build": {"paths": ["/abs/path.py"]}}, "build.paths"),
+    ({"build": {"paths": ["data\\icons"]}}, "build.paths"),
+    ({"build": {"paths_exclude_pattern": ["cache\\*"]}}, "build.paths_exclude_pattern"),
+])
+def test_check_manifest_errors(values, field):
+    errors = bt.check_manifest(valid_manifest(**values))
+    assert [error_field for error_field, _ in errors] == [field]
+
+
+def test_check_manifest_allowed_endings():
+    for tagline in ("Ends with a digit 3", "Ends with a bracket (beta)", "Ünïcode ends in 日本"):
+        assert bt.check_manifest(valid_manifest(tagline=tagline)) == []
+
+
+def test_check_manifest_paths_in_source_dir(tmp_path):
+    (tmp_path / "__init__.py").write_text("", encoding="utf-8")
+    assert bt.check_manifest(valid_manifest(), source_dir=tmp_path) == []
+    errors = bt.check_manifest(valid_manifest(build={"paths": ["missing.py"]}), source_dir=tmp_path)
+    assert errors == [("build.paths", "\"missing.py\" does not exist in the source directory")]
+    # Exclude patterns are not paths : never looked up
+    assert bt.check_manifest(valid_manifest(build={"paths_exclude_pattern": ["*.pyc", "cache/"]}), source_dir=tmp_path) == []
+
+########################•########################
+"""                  LICENSES                 """
+########################•########################
+
+# Local stand-in for spdx.org : serves licenses.json with an ETag, 304 when it matches
+class LicensesServer:
+    def __init__(self):
+        self.etag = '"v1"'
+        self.licenses = [("MIT License", "MIT"), ("GNU General Public License v3.0 or later", "GPL-3.0-or-later")]
+        self.requests = [] # (Path, If-None-Match)
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append((self.path, self.headers.get("If-None-Match")))
+                if self.headers.get("If-None-Match") == server.etag:
+                    self.send_response(304)
+                    self.send_header("ETag", server.etag)
+                    self.end_headers()
+                    return
+                body = json.dumps({
+                    "licenseListVersion": "3.25",
+                    "releaseDate": "2024-08-19",
+                    "licenses": [{"name": name, "licenseId": identifier} for name, identifier in server.licenses],
+                }).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", server.etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/licenses.json"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    pytest.importorskip("requests")
+    server = LicensesServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def offline_url():
+    # A port nothing listens on
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/licenses.json"
+
+
+def test_fetch_licenses_then_not_modified(server, tmp_path):
+    cache = bt.LicenseCache(file_path=tmp_path / "licenses.json")
+    assert bt.fetch_licenses(cache, url=server.url) is True
+    assert cache.licenses == {"MIT License": "MIT", "GNU General Public License v3.0 or later": "GPL-3.0-or-later"}
+    assert cache.etag == '"v1"'
+    assert server.requests[-1][1] is None
+    # Revalidation : conditional request, 304 keeps the stored list
+    fetched_at = cache.fetched_at
+    assert bt.fetch_licenses(cache, url=server.url) is False
+    assert server.requests[-1][1] == '"v1"'
+    assert cache.fetched_at >= fetched_at
+    stored = bt.LicenseCache(file_path=cache.file_path)
+    assert stored.load() and stored.licenses == cache.licenses and stored.etag == '"v1"'
+
+
+def test_set_licenses_revalidates_stale_cache(server, tmp_path):
+    cache_path = tmp_path / "licenses.json"
+    cache = bt.LicenseCache(file_path=cache_path)
+    bt.fetch_licenses(cache, url=server.url)
+    # New list upstream : the cached one is published first, then the update
+    server.etag = '"v2"'
+    server.licenses.append(("Apache License 2.0", "Apache-2.0"))
+    updates = []
+    bt.set_licenses(url=server.url, cache_path=cache_path, snapshot_path=tmp_path / "missing.json", ttl=0, on_update=updates.append)
+    assert len(updates) == 2
+    assert "Apache License 2.0" not in updates[0]
+    assert updates[1]["Apache License 2.0"] == "SPDX:Apache-2.0"
+
+
+def test_set_licenses_offline_uses_cache(server, offline_url, tmp_path):
+    cache_path = tmp_path / "licenses.json"
+    bt.fetch_licenses(bt.LicenseCache(file_path=cache_path), url=server.url)
+    updates = []
+    bt.set_licenses(url=offline_url, cache_path=cache_path, snapshot_path=tmp_path / "missing.json", ttl=0, on_update=updates.append)
+    assert updates == [{"MIT License": "SPDX:MIT", "GNU General Public License v3.0 or later": "SPDX:GPL-3.0-or-later"}]
+
+
+def test_set_licenses_offline_falls_back_to_snapshot(offline_url, tmp_path):
+    pytest.importorskip("requests")
+    snapshot = bt.LicenseCache(file_path=tmp_path / "snapshot.json")
+    snapshot.licenses = {"MIT License": "MIT"}
+    snapshot.version = "3.25"
+    snapshot.save()
+    updates = []
+    bt.set_licenses(url=offline_url, cache_path=tmp_path / "licenses.json", snapshot_path=snapshot.file_path, ttl=0, on_update=updates.append)
+    assert updates == [{"MIT License": "SPDX:MIT"}]
+
+########################•########################
+"""                 DETECTORS                 """
+########################•########################
+
+def test_detect_licenses_bundled_fingerprints(tmp_path):
+    # Bundled index : a format or tokenizer change without a rebuild fails here
+    fingerprints = bt.LicenseFingerprints()
+    assert fingerprints.load()
+    repo = Path(__file__).resolve().parents[1]
+    (tmp_path / "vendor").mkdir()
+    (tmp_path / "vendor" / "LICENSE").write_text((repo / "LICENSE").read_text(encoding="utf-8"), encoding="utf-8")
+    (tmp_path / "__init__.py").write_text("# SPDX-License-Identifier: MIT\n", encoding="utf-8")
+    detections = bt.detect_licenses(str(tmp_path), fingerprints=fingerprints)
+    found = {identifier: (Path(file_path).name, score) for identifier, file_path, score in detections}
+    assert found["MIT"] == ("__init__.py", 1.0)
+    assert found["GPL-3.0-or-later"][0] == "LICENSE"
+    assert found["GPL-3.0-or-later"][1] >= 0.9
+
+########################•########################
+"""                 COMMANDERS                """
+########################•########################
+
+@pytest.mark.skipif(os.name != "posix", reason="uses sh")
+def test_run_command_waits_after_output_closes():
+    # Output closed before exit : waited for, not killed
+    lines = list(bt.run_command(["sh", "-c", "echo hi; exec 1>&- 2>&-; sleep 0.3; exit 3"]))
+    assert lines == ["hi", "Error : Return code 3"]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="uses sh")
+def test_run_command_close_kills_process():
+    lines = bt.run_command(["sh", "-c", "echo hi; sleep 30"])
+    assert next(lines) == "hi"
+    lines.close()
+
+########################•########################
+"""                 PROFILING                 """
+########################•########################
+
+def test_profiler_wraps_commands_and_flush(history, monkeypatch):
+    # No display : stand in for Tcl, which only needs the callable registered
+    monkeypatch.setattr(bt.tk.Misc, "_register", lambda widget, func, subst=None, needcleanup=1: func)
+    monkeypatch.setattr(bt.tk.Misc, "register", bt.tk.Misc._register)
+    profiler = bt.HandlerProfiler()
+    profiler.install()
+    try:
+        def validate(text):
+            return True
+        command = bt.tk.Misc.register(None, validate)
+        assert command("a") is True
+        bound = profiler.wrap("bound", validate)
+        assert bt.tk.Misc._register(None, bound) is bound
+        bt.UpdateScheduler.flush()
+    finally:
+        profiler.uninstall()
+    assert len(profiler.timings[f"command {validate.__qualname__}"]) == 1
+    assert len(profiler.timings["UpdateScheduler.flush"]) == 1
+    assert not getattr(bt.UpdateScheduler.flush, "profiled", False)